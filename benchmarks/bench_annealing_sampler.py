@@ -0,0 +1,145 @@
+"""Latency and distribution check for fast_simulated_annealing.
+
+    python benchmarks/bench_annealing_sampler.py [samples]
+
+For a few positions this times simulated_annealing against
+fast_simulated_annealing, computes the exact distribution of the direction
+simulated_annealing returns (by running its Markov chain over the start
+direction and the four moves through the whole cooling schedule), and runs
+a chi-square goodness-of-fit test of both samplers against it, once per
+seed in SEEDS with a random.Random of that seed. The samplers are fixed by
+their seeds, so the run is repeatable, and it exits with status 1 if any
+p-value falls below P_FLOOR: a sampler drawing from the wrong distribution
+gets p-values near 0 at these sample sizes, an exact one fails a given test
+with probability P_FLOOR.
+"""
+
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snakecore.engine import Snake
+from snakecore.local_search import (MOVES, annealing_schedule, fast_simulated_annealing,
+                                    simulated_annealing)
+
+WIDTH, HEIGHT = 20, 20
+SEEDS = range(5)
+P_FLOOR = 1e-4
+
+
+def snake(body, direction):
+    s = Snake(0, 0, direction)
+    s.body = body
+    return s
+
+
+POSITIONS = {
+    'open board': (snake([(10, 10), (9, 10), (8, 10)], (1, 0)), (14, 3)),
+    'food behind': (snake([(10, 10), (11, 10), (12, 10)], (-1, 0)), (15, 10)),
+    # The move toward the food is blocked, so every valid move is uphill from the start
+    'blocked': (snake([(5, 5), (6, 5), (7, 5), (7, 6)], (-1, 0)), (8, 5)),
+    'corner': (snake([(0, 1), (0, 2), (0, 3)], (0, -1)), (5, 0)),
+}
+
+
+def exact_distribution(s, food, temperature=10.0, cooling_rate=0.99):
+    """{direction: probability} that simulated_annealing returns, from its Markov chain."""
+    head = s.body[0]
+    start = math.sqrt((head[0] - food[0])**2 + (head[1] - food[1])**2)
+    distances = []
+    for dx, dy in MOVES:
+        x, y = head[0] + dx, head[1] + dy
+        ok = 0 <= x < WIDTH and 0 <= y < HEIGHT and not s.collides((x, y))
+        distances.append(math.sqrt((x - food[0])**2 + (y - food[1])**2) if ok else None)
+    # State 4 is the start direction at the start distance, 0-3 the moves
+    state_distance = distances + [start]
+    probabilities = [0.0, 0.0, 0.0, 0.0, 1.0]
+    temperatures, _ = annealing_schedule(temperature, cooling_rate)
+    for t in temperatures:
+        new = [0.0] * 5
+        for state, p in enumerate(probabilities):
+            if not p:
+                continue
+            here = state_distance[state]
+            for move, distance in enumerate(distances):
+                if distance is None:
+                    new[state] += p / 4
+                    continue
+                accept = 1.0 if distance < here else math.exp((here - distance) / t)
+                new[move] += p / 4 * accept
+                new[state] += p / 4 * (1 - accept)
+        probabilities = new
+    result = {}
+    for state, p in enumerate(probabilities):
+        direction = s.direction if state == 4 else MOVES[state]
+        result[direction] = result.get(direction, 0.0) + p
+    return result
+
+
+def chi_square_p(observed, expected):
+    """Goodness-of-fit p-value; directions expected less than 5 times are pooled."""
+    pooled_observed = pooled_expected = 0.0
+    cells = []
+    for direction, e in expected.items():
+        if e < 5:
+            pooled_observed += observed.get(direction, 0)
+            pooled_expected += e
+        else:
+            cells.append((observed.get(direction, 0), e))
+    if pooled_expected:
+        cells.append((pooled_observed, pooled_expected))
+    statistic = sum((o - e) ** 2 / e for o, e in cells)
+    df = len(cells) - 1
+    x = statistic / 2
+    if df <= 0:
+        return 1.0
+    if df == 1:
+        return math.erfc(math.sqrt(x))
+    if df == 2:
+        return math.exp(-x)
+    if df == 3:
+        return math.erfc(math.sqrt(x)) + math.sqrt(4 * x / math.pi) * math.exp(-x)
+    return math.exp(-x) * (1 + x + x * x / 2)  # df == 4
+
+
+def sample(function, s, food, samples, rng):
+    counts = {}
+    start = time.perf_counter()
+    for _ in range(samples):
+        direction = function(s, food, width=WIDTH, height=HEIGHT, rng=rng)
+        counts[direction] = counts.get(direction, 0) + 1
+    return counts, (time.perf_counter() - start) / samples
+
+
+def main():
+    samples = int(sys.argv[1]) if len(sys.argv) > 1 else 4000
+    print('%-12s %5s %12s %12s %8s %10s %10s' % ('position', 'seed', 'scalar us', 'fast us', 'speedup',
+                                                 'scalar p', 'fast p'))
+    failures = 0
+    for name, (s, food) in POSITIONS.items():
+        exact = exact_distribution(s, food)
+        expected = {direction: p * samples for direction, p in exact.items()}
+        fast_expected = {direction: e * 10 for direction, e in expected.items()}
+        for seed in SEEDS:
+            slow_counts, slow_time = sample(simulated_annealing, s, food, samples, random.Random(seed))
+            fast_counts, fast_time = sample(fast_simulated_annealing, s, food, samples * 10, random.Random(seed))
+            slow_p, fast_p = chi_square_p(slow_counts, expected), chi_square_p(fast_counts, fast_expected)
+            failed = min(slow_p, fast_p) < P_FLOOR
+            failures += failed
+            print('%-12s %5d %12.1f %12.2f %7.0fx %10.3f %10.3f%s' % (
+                name, seed, slow_time * 1e6, fast_time * 1e6, slow_time / fast_time, slow_p, fast_p,
+                '  FAIL' if failed else ''))
+    if failures:
+        print('\n%d tests with a p-value below %g: a sampler does not match the exact distribution' % (
+            failures, P_FLOOR))
+        return 1
+    print('\nevery p-value is above %g' % P_FLOOR)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
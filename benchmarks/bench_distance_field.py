@@ -0,0 +1,60 @@
+"""Cost of a DistanceField and what A* gets out of it.
+
+    python benchmarks/bench_distance_field.py
+
+A wall with a single gap splits the board, the head sits on one side and
+the food on the other, so straight-line distance points the wrong way. For
+each board size this reports the time of one field BFS, and the cells A*
+explores and its time with the Euclidean heuristic and with the field
+(field time includes the BFS). Both must find paths of the same length.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snakecore.board import Board
+from snakecore.distance import DistanceField
+from snakecore.search import astar
+
+
+def walled(width, height):
+    """A board with a vertical wall down the middle, open only at the bottom row."""
+    board = Board(width, height)
+    board.place([(width // 2, y) for y in range(height - 1)])
+    return board
+
+
+def timed(function, repeat=5):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        result = function()
+    return result, (time.perf_counter() - start) / repeat
+
+
+def main():
+    print('%-8s %9s %14s %12s %14s %12s' % ('board', 'BFS (ms)', 'euclid cells', 'euclid (ms)', 'field cells',
+                                            'field (ms)'))
+    for width, height in ((20, 20), (32, 24), (80, 60)):
+        board = walled(width, height)
+        head, food = board.cell(width // 2 - 3, 0), board.cell(width // 2 + 3, 0)
+        field = DistanceField(board)
+
+        def build():
+            field.food = None  # force a new search
+            return field.update(board, food)
+        _, bfs_time = timed(build)
+
+        euclid_trace = bytearray(board.size)
+        euclid_path, euclid_time = timed(lambda: astar(board, head, food, euclid_trace))
+        field_trace = bytearray(board.size)
+        field_path, field_time = timed(lambda: astar(board, head, food, field_trace, build().distances))
+        assert len(euclid_path) == len(field_path)
+        print('%-8s %9.2f %14d %12.2f %14d %12.2f' % ('%dx%d' % (width, height), bfs_time * 1e3, sum(euclid_trace),
+                                                      euclid_time * 1e3, sum(field_trace), field_time * 1e3))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,74 @@
+"""Food spawning by rejection sampling against a pick from FreeCells.
+
+    python benchmarks/bench_food_spawn.py
+
+Fills 20x20 and 80x60 boards to a range of fractions and times one spawn
+both ways: drawing random cells until one is free, as the engine used to,
+and one randrange into the engine's FreeCells. Rejection sampling needs
+size / free draws on average, so it slows down without bound as the board
+fills; the pick costs the same at any fill. Also times the FreeCells
+updates a move makes (one discard at the head, one add at the tail).
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snakecore.board import Board, FreeCells
+
+FILLS = (0.0, 0.5, 0.9, 0.99, 0.999)
+SPAWNS = 20000
+
+
+def rejection(board, rng):
+    occupied, size = board.occupied, board.size
+    while True:
+        cell = rng.randrange(size)
+        if not occupied[cell]:
+            return cell
+
+
+def filled_board(width, height, fill, rng):
+    board = Board(width, height)
+    cells = list(range(board.size))
+    rng.shuffle(cells)
+    # Always leave one cell free, so there is somewhere to spawn
+    for cell in cells[:min(int(fill * board.size), board.size - 1)]:
+        board.occupy(cell)
+    return board
+
+
+def per_call(function, *args):
+    start = time.perf_counter()
+    for _ in range(SPAWNS):
+        function(*args)
+    return 1e6 * (time.perf_counter() - start) / SPAWNS
+
+
+def main():
+    print('%-8s %7s %6s %15s %12s %9s' % ('board', 'fill', 'free', 'rejection (us)', 'choice (us)', 'speedup'))
+    for width, height in ((20, 20), (80, 60)):
+        for fill in FILLS:
+            rng = random.Random(0)
+            board = filled_board(width, height, fill, rng)
+            free_cells = FreeCells(board)
+            slow = per_call(rejection, board, rng)
+            fast = per_call(free_cells.choice, rng)
+            print('%-8s %6.1f%% %6d %15.2f %12.2f %8.1fx' % (
+                '%dx%d' % (width, height), 100 * fill, len(free_cells), slow, fast, slow / fast))
+
+    board = filled_board(80, 60, 0.5, random.Random(0))
+    free_cells = FreeCells(board)
+    cell = free_cells.cells[0]
+
+    def move():
+        free_cells.discard(cell)
+        free_cells.add(cell)
+    print('\nmove update (discard + add): %.3f us' % per_call(move))
+
+
+if __name__ == '__main__':
+    main()
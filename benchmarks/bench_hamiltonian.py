@@ -0,0 +1,53 @@
+"""Full-board games with HamiltonianAgent and what each move costs.
+
+    python benchmarks/bench_hamiltonian.py [WIDTHxHEIGHT ...]
+
+Plays one single-snake game per board size (20x20, 32x24 and 80x60 by
+default) until the snake fills the board, and reports the moves played,
+the final length, how many moves were shortcuts, and the agent's time per
+move: mean, 99th percentile and worst. The cycle is loaded before the clock
+starts, so the times are the O(1) decision alone.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snakecore.engine import SnakeEngine
+from snakecore.hamiltonian import HamiltonianAgent, cycle_order
+
+
+def play(width, height, seed=0):
+    engine = SnakeEngine(width, height, seed=seed)
+    agent = HamiltonianAgent()
+    cycle_order(width, height, agent.cache_dir)
+    timings = []
+    clock = time.perf_counter
+    done = False
+    while not done:
+        obs = engine.observe()
+        start = clock()
+        direction = agent(obs)
+        timings.append(clock() - start)
+        done = engine.step([direction])
+    return engine, agent, timings
+
+
+def main():
+    sizes = [tuple(map(int, arg.split('x'))) for arg in sys.argv[1:]] or [(20, 20), (32, 24), (80, 60)]
+    print('%-8s %10s %8s %6s %10s %10s %10s %10s' % ('board', 'moves', 'length', 'full', 'shortcuts', 'mean (us)',
+                                                     'p99 (us)', 'max (us)'))
+    for width, height in sizes:
+        engine, agent, timings = play(width, height)
+        snake = engine.snakes[0]
+        timings.sort()
+        print('%-8s %10d %8d %6s %10d %10.2f %10.2f %10.2f' % (
+            '%dx%d' % (width, height), engine.steps, snake.length, 'yes' if snake.length == width * height else 'no',
+            agent.shortcuts, sum(timings) / len(timings) * 1e6, timings[len(timings) * 99 // 100] * 1e6,
+            timings[-1] * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,66 @@
+"""Check that the mcts agent eats in single-snake games, and how long it takes a move.
+
+    python benchmarks/bench_mcts.py [playouts]
+
+Plays one 20x20 game of MAX_STEPS moves per seed in SEEDS with
+MCTSAgent(playouts) and prints the score, food per 100 moves and time per
+move. A playout that valued eating now the same as eating in ten moves
+left the snake circling next to the food (seed 3 ended with score 0), so
+the run exits with status 1 if any game ends without eating, or if a
+search from a head one step from the food does not take it.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snakecore.board import DIRECTION_INDEX, UP
+from snakecore.engine import SnakeEngine
+from snakecore.mcts import MCTS, MCTSAgent, Position, best_move
+
+WIDTH, HEIGHT = 20, 20
+MAX_STEPS = 200
+SEEDS = range(6)
+
+
+def play(seed, playouts):
+    engine = SnakeEngine(WIDTH, HEIGHT, max_steps=MAX_STEPS, seed=seed)
+    agent = MCTSAgent(playouts=playouts, seed=seed)
+    start = time.perf_counter()
+    while not engine.step([agent(engine.observe(), 0)]):
+        pass
+    return engine, (time.perf_counter() - start) / engine.steps
+
+
+def takes_food(playouts):
+    """Whether a search from (1, 7), with the food at (1, 6), moves UP onto it."""
+    position = Position(WIDTH, HEIGHT, False, [[(1, 7), (2, 7), (3, 7)], []], (1, 6), random.Random(0))
+    return best_move(MCTS(position).search(playouts)) == DIRECTION_INDEX[UP]
+
+
+def main():
+    playouts = int(sys.argv[1]) if len(sys.argv) > 1 else 100
+    print('%5s %9s %6s %6s %15s %10s' % ('seed', 'outcome', 'steps', 'score', 'food/100 moves', 'ms/move'))
+    failures = 0
+    for seed in SEEDS:
+        engine, seconds = play(seed, playouts)
+        score = engine.snakes[0].score
+        failures += not score
+        print('%5d %9s %6d %6d %15.1f %10.1f%s' % (seed, engine.outcome, engine.steps, score,
+                                                   100.0 * score / engine.steps, seconds * 1e3,
+                                                   '  FAIL' if not score else ''))
+    if not takes_food(playouts):
+        failures += 1
+        print('\nFAIL: the search does not take the food one step away')
+    if failures:
+        print('\n%d failed checks: the mcts agent does not go for the food' % failures)
+        return 1
+    print('\nevery game ate, and the search takes food one step away')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Leaf evaluations per second for AISnake.evaluate, by snake length.
+
+    python benchmarks/bench_minimax_eval.py
+
+Both snakes are coiled back and forth across the 32x24 arena. The
+"full scan" column is the original evaluator, which looped over every cell
+of the grid checking list membership against both bodies.
+"""
+
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snakecore.engine import Snake
+from snakecore.minimax import AISnake
+
+WIDTH, HEIGHT = 32, 24
+
+
+def coiled(length, first_row):
+    """A body `length` cells long snaking left and right from `first_row` down."""
+    body = []
+    for y in range(first_row, HEIGHT):
+        row = [(x, y) for x in range(WIDTH)]
+        body.extend(row if (y - first_row) % 2 == 0 else reversed(row))
+    snake = Snake(0, 0)
+    snake.body = body[:length][::-1]
+    return snake
+
+
+def full_scan_evaluate(snake_body, opponent_body, food):
+    head = snake_body[0]
+    distance_to_food = abs(head[0] - food[0]) + abs(head[1] - food[1])
+    distance_to_opponent = min(abs(head[0] - x) + abs(head[1] - y) for x, y in opponent_body)
+    opponent_penalty = 50 if distance_to_opponent < 2 else 0
+    self_penalty = 100 if head in snake_body[2:] else 0
+    empty_space_score = sum(1 for x in range(WIDTH) for y in range(HEIGHT)
+                            if (x, y) not in snake_body and (x, y) not in opponent_body)
+    return 1000 - distance_to_food + empty_space_score - opponent_penalty - self_penalty + random.uniform(0, 1)
+
+
+def rate(function, seconds=0.3):
+    calls = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        for _ in range(10):
+            function()
+        calls += 10
+    return calls / seconds
+
+
+def main():
+    print('%8s %16s %18s' % ('length', 'evals/s', 'full scan evals/s'))
+    for length in (10, 50, 150, 300):
+        snake = coiled(length, 0)
+        opponent = coiled(length, HEIGHT // 2)
+        food = (WIDTH - 1, HEIGHT // 2 - 1)
+        ai = AISnake(snake, opponent, food, WIDTH, HEIGHT)
+        ai.setup_board()
+        fast = rate(ai.evaluate)
+        slow = rate(lambda: full_scan_evaluate(list(snake.body), list(opponent.body), food))
+        print('%8d %16.0f %18.0f' % (length, fast, slow))
+
+
+if __name__ == '__main__':
+    main()
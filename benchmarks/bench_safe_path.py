@@ -0,0 +1,70 @@
+"""What safe-path mode costs the search agents per decision, and what it buys.
+
+    python benchmarks/bench_safe_path.py
+
+Plays the same seeded single-snake games with each search agent, plain and
+in safe mode, and reports the mean score, the agent's time per move, the
+searches run, and in safe mode the time spent checking paths (moving a
+RingBody along each new path and searching back to the tail) and the moves
+spent chasing the tail.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snakecore import search
+from snakecore.agents import SearchAgent
+from snakecore.engine import SnakeEngine
+
+GAMES, MAX_STEPS = 5, 2000
+SEARCHES = ('bfs', 'ucs', 'astar', 'dfs')
+
+
+def play(agent, width, height, seed):
+    engine = SnakeEngine(width, height, max_steps=MAX_STEPS, seed=seed)
+    agent.reset()
+    planner = agent.planner
+    check = planner.leaves_way_out
+    spent = [0.0, 0.0]  # every decision, and the safety checks within them
+
+    def timed_check(*args):
+        start = time.perf_counter()
+        result = check(*args)
+        spent[1] += time.perf_counter() - start
+        return result
+    planner.leaves_way_out = timed_check
+
+    done = False
+    while not done:
+        obs = engine.observe()
+        start = time.perf_counter()
+        direction = agent(obs)
+        spent[0] += time.perf_counter() - start
+        done = engine.step([direction])
+    del planner.leaves_way_out
+    return engine.snakes[0].score, engine.steps, spent, planner.searches, planner.tail_chases
+
+
+def main():
+    print('%-8s %-6s %5s %8s %8s %11s %10s %11s %8s' % ('board', 'search', 'safe', 'score', 'moves', 'move (us)',
+                                                         'searches', 'check (us)', 'chases'))
+    for width, height in ((20, 20), (32, 24)):
+        for name in SEARCHES:
+            for safe in (False, True):
+                agent = SearchAgent(getattr(search, name), safe=safe)
+                totals = [0, 0, 0.0, 0.0, 0, 0]
+                for seed in range(GAMES):
+                    score, steps, (move_time, check_time), searches, chases = play(agent, width, height, seed)
+                    for i, value in enumerate((score, steps, move_time, check_time, searches, chases)):
+                        totals[i] += value
+                score, steps, move_time, check_time, searches, chases = totals
+                print('%-8s %-6s %5s %8.1f %8.1f %11.1f %10.1f %11.1f %8.1f' % (
+                    '%dx%d' % (width, height), name, 'yes' if safe else 'no', score / GAMES, steps / GAMES,
+                    move_time / steps * 1e6, searches / GAMES, check_time / steps * 1e6, chases / GAMES))
+
+
+if __name__ == '__main__':
+    main()
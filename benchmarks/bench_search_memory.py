@@ -0,0 +1,112 @@
+"""Peak memory, allocations and time of one path search on the full 80x60 board.
+
+    python benchmarks/bench_search_memory.py
+
+The head starts in one corner and the food sits in the opposite one, so
+every search has to cover (almost) the whole empty board.
+
+Each of bfs, ucs and astar is measured against the path-copying version it
+replaced (below), which carried a copy of the path to every cell on its
+frontier entry, and the table shows how many times less memory the search
+needs at its peak. The board has been searched once before each
+measurement, as it has in a game, so its reused parent and move arrays (see
+search.py) are already allocated; their size is printed below the table.
+"""
+
+import heapq
+import os
+import sys
+import time
+import tracemalloc
+from collections import deque
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snakecore.board import Board
+from snakecore.search import astar, bfs, dfs_path, euclidean_distance, ucs
+
+WIDTH, HEIGHT = 80, 60
+
+
+def copying_bfs(board, snake_head, food):
+    queue = deque([(snake_head, [])])
+    visited = set()
+    while queue:
+        current_pos, path = queue.popleft()
+        if current_pos == food:
+            return path
+        for direction, next_pos in board.neighbors[current_pos]:
+            if next_pos not in visited and not board.occupied[next_pos]:
+                queue.append((next_pos, path + [direction]))
+                visited.add(next_pos)
+    return []
+
+
+def copying_ucs(board, snake_head, food):
+    queue = [(0, snake_head, [])]
+    visited = set()
+    while queue:
+        cost, current_pos, path = heapq.heappop(queue)
+        if current_pos == food:
+            return path
+        if current_pos not in visited:
+            visited.add(current_pos)
+            for direction, next_pos in board.neighbors[current_pos]:
+                if not board.occupied[next_pos]:
+                    heapq.heappush(queue, (cost + 1, next_pos, path + [direction]))
+    return []
+
+
+def copying_astar(board, snake_head, food):
+    heap = [(0, snake_head, [])]
+    visited = set()
+    food_xy = board.xy(food)
+    while heap:
+        f_cost, current_pos, path = heapq.heappop(heap)
+        if current_pos == food:
+            return path
+        if current_pos not in visited:
+            visited.add(current_pos)
+            for direction, next_pos in board.neighbors[current_pos]:
+                if not board.occupied[next_pos]:
+                    f_cost = len(path) + 1 + euclidean_distance(board.xy(next_pos), food_xy)
+                    heapq.heappush(heap, (f_cost, next_pos, path + [direction]))
+    return []
+
+
+BASELINES = {bfs: copying_bfs, ucs: copying_ucs, astar: copying_astar}
+
+
+def measure(search, board, start, goal, repeat=5):
+    search(board, start, goal)
+    tracemalloc.start()
+    search(board, start, goal)
+    current, peak = tracemalloc.get_traced_memory()
+    blocks = len(tracemalloc.take_snapshot().traces)
+    tracemalloc.stop()
+
+    begin = time.perf_counter()
+    for _ in range(repeat):
+        search(board, start, goal)
+    return peak, blocks, (time.perf_counter() - begin) / repeat
+
+
+def main():
+    board = Board(WIDTH, HEIGHT)
+    start, goal = board.cell(0, 0), board.cell(WIDTH - 1, HEIGHT - 1)
+    print('%-10s %14s %12s %10s %21s %15s' % ('search', 'peak (KiB)', 'live blocks', 'time (ms)',
+                                              'path-copying (KiB)', 'less memory'))
+    for search in (bfs, ucs, astar, dfs_path):
+        peak, blocks, seconds = measure(search, board, start, goal)
+        line = '%-10s %14.1f %12d %10.2f' % (search.__name__, peak / 1024, blocks, seconds * 1e3)
+        if search in BASELINES:
+            baseline, _, _ = measure(BASELINES[search], board, start, goal, repeat=1)
+            line += ' %21.1f %14.1fx' % (baseline / 1024, baseline / peak)
+        print(line)
+    parents, moves, cleared = board.search_buffers
+    print('\nreused per board: %.1f KiB of parent and move arrays' % (
+        (2 * parents.itemsize * len(parents) + len(moves)) / 1024))
+
+
+if __name__ == '__main__':
+    main()
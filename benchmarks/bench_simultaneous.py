@@ -0,0 +1,79 @@
+"""Nodes and time per tick: two alternating-move searches against one joint search.
+
+    python benchmarks/bench_simultaneous.py
+
+The MinimaxTwoSnakeAIs game used to run AISnake.get_best_move once per
+snake every tick. JointSearch decides both moves from one search; depth 1
+(one tick of joint moves) covers the same moves as AISnake at depth 2. Both
+are run on the same positions from a 32x24 self-play game.
+"""
+
+import copy
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snakecore.agents import SimultaneousAgent
+from snakecore.engine import LEFT, RIGHT, SnakeEngine
+from snakecore.minimax import AISnake
+from snakecore.simultaneous import JointSearch
+
+WIDTH, HEIGHT = 32, 24
+
+
+def positions(count=100):
+    random.seed(0)
+    engine = SnakeEngine(WIDTH, HEIGHT, starts=[(WIDTH // 4, HEIGHT // 2, RIGHT), (3 * WIDTH // 4, HEIGHT // 2, LEFT)],
+                         seed=0)
+    agent = SimultaneousAgent()
+    snapshots = []
+    while len(snapshots) < count:
+        obs = engine.observe()
+        snapshots.append((copy.deepcopy(obs.snakes), obs.food))
+        if engine.step([agent(obs, 0), agent(obs, 1)]):
+            engine.reset()
+    return snapshots
+
+
+def alternating(snakes, food, depth):
+    nodes = 0
+    for index in (0, 1):
+        ai = AISnake(snakes[index], snakes[1 - index], food, WIDTH, HEIGHT)
+        ai.get_best_move(depth)
+        nodes += ai.nodes
+    return nodes
+
+
+def joint(snakes, food, depth, solver):
+    search = JointSearch(snakes[0], snakes[1], food, WIDTH, HEIGHT, solver=solver)
+    search.get_best_moves(depth)
+    return search.nodes
+
+
+def measure(snapshots, function, *args):
+    random.seed(1)
+    nodes = 0
+    start = time.perf_counter()
+    for snakes, food in snapshots:
+        nodes += function(snakes, food, *args)
+    elapsed = time.perf_counter() - start
+    return nodes / len(snapshots), elapsed / len(snapshots)
+
+
+def main():
+    snapshots = positions()
+    print('%-28s %12s %10s' % ('search', 'nodes/tick', 'ms/tick'))
+    for ticks in (1, 2):
+        rows = [('2 x AISnake depth %d' % (2 * ticks), alternating, 2 * ticks),
+                ('JointSearch depth %d maximin' % ticks, joint, ticks, 'maximin'),
+                ('JointSearch depth %d regret' % ticks, joint, ticks, 'regret')]
+        for name, function, *args in rows:
+            nodes, elapsed = measure(snapshots, function, *args)
+            print('%-28s %12.1f %10.2f' % (name, nodes, elapsed * 1e3))
+
+
+if __name__ == '__main__':
+    main()
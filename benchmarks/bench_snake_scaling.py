@@ -0,0 +1,90 @@
+"""Time per tick against snake length: list bodies against Snake's deque and cell counter.
+
+    python benchmarks/bench_snake_scaling.py
+
+A snake of each length walks a Hamiltonian cycle of an 80x60 grid, so it
+never dies and never eats. The list tick is what the game scripts used to
+do: insert the new head at index 0, pop the tail and test the head against
+set(body). The Snake tick is Snake.move and Snake.collides. The list tick
+grows with the length; the Snake tick stays flat. Last, whole SnakeEngine
+steps for the same snakes.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snakecore.board import FreeCells
+from snakecore.engine import Snake, SnakeEngine
+from snakecore.hamiltonian import build_cycle
+
+WIDTH, HEIGHT = 80, 60
+LENGTHS = (10, 100, 500, 1000, 2000, 4000)
+TICKS = 20000
+
+
+def cycle_cells():
+    """The grid's cells in the order a Hamiltonian cycle visits them."""
+    order = build_cycle(WIDTH, HEIGHT)
+    return [(cell % WIDTH, cell // WIDTH) for cell in sorted(range(WIDTH * HEIGHT), key=order.__getitem__)]
+
+
+def list_ticks(cells, length):
+    body = cells[:length][::-1]
+    size = len(cells)
+    start = time.perf_counter()
+    for tick in range(length, length + TICKS):
+        new_head = cells[tick % size]
+        body.insert(0, new_head)
+        body.pop()
+        if new_head in set(body[1:]):
+            raise AssertionError('the cycle never crosses itself')
+    return 1e6 * (time.perf_counter() - start) / TICKS
+
+
+def deque_ticks(cells, length):
+    snake = Snake(0, 0)
+    snake.body = cells[:length][::-1]
+    size = len(cells)
+    start = time.perf_counter()
+    for tick in range(length, length + TICKS):
+        new_head = cells[tick % size]
+        if snake.collides(new_head):
+            raise AssertionError('the cycle never crosses itself')
+        snake.move(new_head)
+    return 1e6 * (time.perf_counter() - start) / TICKS
+
+
+def engine_ticks(cells, length):
+    engine = SnakeEngine(WIDTH, HEIGHT, seed=0)
+    board, snake = engine.board, engine.snakes[0]
+    board.vacate(board.cell(*snake.head))
+    snake.body = cells[:length][::-1]
+    board.place(snake.body)
+    engine.free_cells = FreeCells(board)
+    engine.food = (-1, -1)  # nowhere the snake goes, so it keeps its length
+    size = len(cells)
+    moves = []
+    for tick in range(length, length + TICKS):
+        (x, y), (px, py) = cells[tick % size], cells[(tick - 1) % size]
+        moves.append([(x - px, y - py)])
+    start = time.perf_counter()
+    for actions in moves:
+        engine.step(actions)
+    assert snake.alive
+    return 1e6 * (time.perf_counter() - start) / TICKS
+
+
+def main():
+    cells = cycle_cells()
+    print('%8s %14s %14s %9s %16s' % ('length', 'list (us)', 'Snake (us)', 'speedup', 'engine step (us)'))
+    for length in LENGTHS:
+        slow = list_ticks(cells, length)
+        fast = deque_ticks(cells, length)
+        print('%8d %14.2f %14.2f %8.1fx %16.2f' % (length, slow, fast, slow / fast, engine_ticks(cells, length)))
+
+
+if __name__ == '__main__':
+    main()
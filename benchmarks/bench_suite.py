@@ -0,0 +1,201 @@
+"""Throughput of every agent function on the board corpus, with a regression gate.
+
+    python benchmarks/bench_suite.py
+    python benchmarks/bench_suite.py --save before.json
+    python benchmarks/bench_suite.py --baseline before.json --max-regression 0.25
+    python benchmarks/bench_suite.py --history benchmarks/history.jsonl
+
+Runs bfs, ucs, astar, field_astar, dfs_path, hill_climbing,
+simulated_annealing, fast_simulated_annealing and AISnake.get_best_move
+(depth 2, fresh transposition table) on every position in benchmarks/boards
+(see corpus.py) and reports decisions per second and nodes per decision.
+safe_path_check is the check safe mode adds to a search (see
+PathPlanner.leaves_way_out): moving the snake along the BFS path to the
+food, planned once per board, and searching back to its tail.
+
+Each function is called on the same position for `--rounds` rounds of
+`--time` seconds with the garbage collector off, as timeit does, and the
+fastest round counts, which keeps a busy machine from passing for a
+regression. On a noisy machine raise `--rounds` before trusting the gate.
+The searches get the head of the first snake and its food; on the melee
+boards minimax plays against the second snake.
+
+`--save` writes the results as JSON and `--history` appends them as one line
+to a file, with the commit and the time, to follow throughput over time.
+`--baseline` compares against saved results and exits with status 1 if any
+function got more than `--max-regression` slower on any board.
+"""
+
+import argparse
+import fnmatch
+import gc
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from corpus import load_corpus
+
+from snakecore import search
+from snakecore.engine import Snake
+from snakecore.instrument import SearchStats
+from snakecore.local_search import fast_simulated_annealing, hill_climbing, simulated_annealing
+from snakecore.minimax import AISnake
+from snakecore.planner import PathPlanner
+from snakecore.transposition import TranspositionTable
+
+
+def graph_search(function):
+    def decide(position, stats):
+        board = position.board
+        board.distance_field = None  # field_astar builds its field as part of the decision
+        return function(board, board.cell(*position.snakes[0].head), board.cell(*position.food), stats=stats)
+    return decide
+
+
+def dfs_path(position, stats):
+    board = position.board
+    return search.dfs_path(board, board.cell(*position.snakes[0].head), board.cell(*position.food), stats)
+
+
+def safe_path_check(position, stats):
+    planner = getattr(position, 'safe_planner', None)
+    if planner is None:
+        # The path is planned once; only the check is timed
+        board = position.board
+        planner = position.safe_planner = PathPlanner(search.bfs, safe=True)
+        planner.plan(board, board.cell(*position.snakes[0].head), board.cell(*position.food))
+    planner.stats = stats
+    return planner.leaves_way_out(position.board, position.snakes[0].body, planner.target)
+
+
+def local_search(function):
+    def decide(position, stats):
+        return function(position.snakes[0], position.food, width=position.width, height=position.height,
+                        stats=stats)
+    return decide
+
+
+def minimax(position, stats):
+    if len(position.snakes) > 1:
+        opponent = position.snakes[1]
+    else:
+        opponent = Snake(0, 0)
+        opponent.body = []
+    ai = AISnake(position.snakes[0], opponent, position.food, position.width, position.height, position.wrap,
+                 table=TranspositionTable(12))
+    move = ai.get_best_move(2)
+    stats.add(ai.nodes, 0, ai.completed_depth)
+    return move
+
+
+FUNCTIONS = {
+    'bfs': graph_search(search.bfs),
+    'ucs': graph_search(search.ucs),
+    'astar': graph_search(search.astar),
+    'field_astar': graph_search(search.field_astar),
+    'dfs_path': dfs_path,
+    'safe_path_check': safe_path_check,
+    'hill_climbing': local_search(hill_climbing),
+    'simulated_annealing': local_search(simulated_annealing),
+    'fast_simulated_annealing': local_search(fast_simulated_annealing),
+    'minimax': minimax,
+}
+
+
+def measure(function, position, seconds, rounds):
+    """(decisions per second in the fastest round, nodes per decision) for `function` on `position`."""
+    stats = SearchStats()
+    best = 0.0
+    total_calls = 0
+    clock = time.perf_counter
+    gc.collect()
+    gc.disable()
+    try:
+        for _ in range(rounds):
+            calls = 0
+            start = clock()
+            end = start + seconds
+            while True:
+                function(position, stats)
+                calls += 1
+                now = clock()
+                if now >= end:
+                    break
+            best = max(best, calls / (now - start))
+            total_calls += calls
+    finally:
+        gc.enable()
+    return best, stats.nodes / total_calls
+
+
+def commit():
+    try:
+        return subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__)), check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, max_regression):
+    """Lines describing every result more than `max_regression` slower than in `baseline`."""
+    regressions = []
+    for key, rate in sorted(results.items()):
+        before = baseline.get(key)
+        if before and rate < before * (1.0 - max_regression):
+            regressions.append('%-40s %12.1f -> %12.1f /s (%+.0f%%)' % (key, before, rate,
+                                                                       100.0 * (rate / before - 1)))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--boards', default='*', help='glob over board names, e.g. "*-80x60"')
+    parser.add_argument('--functions', nargs='+', default=list(FUNCTIONS), choices=list(FUNCTIONS))
+    parser.add_argument('--time', type=float, default=0.1, help='seconds per round')
+    parser.add_argument('--rounds', type=int, default=3, help='rounds per function and board')
+    parser.add_argument('--seed', type=int, default=0, help='seed for the functions that draw random numbers')
+    parser.add_argument('--save', help='write the results to this JSON file')
+    parser.add_argument('--history', help='append the results as one JSON line to this file')
+    parser.add_argument('--baseline', help='JSON file from --save to compare against')
+    parser.add_argument('--max-regression', type=float, default=0.25,
+                        help='slowdown against the baseline that fails the run (default 0.25)')
+    args = parser.parse_args(argv)
+
+    random.seed(args.seed)
+    corpus = {name: position for name, position in load_corpus().items() if fnmatch.fnmatch(name, args.boards)}
+    results = {}
+    print('%-18s %-26s %14s %12s %14s' % ('board', 'function', 'decisions/s', 'us/decision', 'nodes/decision'))
+    for name, position in corpus.items():
+        for function_name in args.functions:
+            rate, nodes = measure(FUNCTIONS[function_name], position, args.time, args.rounds)
+            results['%s/%s' % (name, function_name)] = rate
+            print('%-18s %-26s %14.1f %12.1f %14.1f' % (name, function_name, rate, 1e6 / rate, nodes))
+
+    record = {'commit': commit(), 'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': platform.python_version(),
+              'results': results}
+    if args.save:
+        with open(args.save, 'w') as file:
+            json.dump(record, file, indent=1, sort_keys=True)
+    if args.history:
+        with open(args.history, 'a') as file:
+            file.write(json.dumps(record, sort_keys=True) + '\n')
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, args.max_regression)
+        if regressions:
+            print('\n%d regressions of more than %.0f%%:' % (len(regressions), 100 * args.max_regression))
+            print('\n'.join(regressions))
+            return 1
+        print('\nno regressions of more than %.0f%% against %s' % (100 * args.max_regression, args.baseline))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
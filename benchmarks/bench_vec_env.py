@@ -0,0 +1,60 @@
+"""Environment steps per second: SnakeEngine against VecSnakeEnv, by batch size.
+
+    python benchmarks/bench_vec_env.py
+
+Every game is a single snake on a 20x20 grid driven by uniformly random
+direction codes, so games are short and the reset path is exercised as much
+as the step path. One env-step is one move in one game.
+"""
+
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snakecore.engine import DIRECTIONS, SnakeEngine
+from snakecore.vec import VecSnakeEnv
+
+WIDTH, HEIGHT = 20, 20
+
+
+def scalar_rate(seconds=1.0):
+    engine = SnakeEngine(WIDTH, HEIGHT, seed=0)
+    rng = random.Random(0)
+    steps = 0
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        for _ in range(100):
+            if engine.step([rng.choice(DIRECTIONS)]):
+                engine.reset()
+        steps += 100
+    return steps / seconds
+
+
+def vector_rate(batch, seconds=1.0):
+    env = VecSnakeEnv(batch, WIDTH, HEIGHT, seed=0)
+    rng = np.random.default_rng(0)
+    actions = rng.integers(0, 4, (64, batch))
+    steps = 0
+    start = time.perf_counter()
+    while time.perf_counter() - start < seconds:
+        for row in actions:
+            env.step(row)
+        steps += len(actions) * batch
+    return steps / (time.perf_counter() - start), env.games
+
+
+def main():
+    print('%-22s %14s' % ('environment', 'env-steps/s'))
+    print('%-22s %14.0f' % ('SnakeEngine', scalar_rate()))
+    for batch in (1, 64, 1024, 4096, 16384):
+        rate, games = vector_rate(batch)
+        print('%-22s %14.0f' % ('VecSnakeEnv x %d' % batch, rate))
+
+
+if __name__ == '__main__':
+    main()
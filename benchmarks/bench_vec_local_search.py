@@ -0,0 +1,79 @@
+"""Moves decided per second by the scalar and batched local search policies.
+
+    python benchmarks/bench_vec_local_search.py
+
+The batches are VecSnakeEnv games on a 20x20 grid, played for a while with
+batched hill climbing so the snakes have some length. The scalar column
+calls local_search on the same positions one game at a time, and every
+batch is checked to choose the same moves as the scalar functions. The
+last column anneals with one numpy Generator instead of a random.Random
+per game: same distribution, different draws.
+"""
+
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snakecore import local_search, vec_local_search
+from snakecore.engine import DIRECTIONS, Snake
+from snakecore.vec import VecSnakeEnv
+
+WIDTH, HEIGHT = 20, 20
+
+
+def snakes(env):
+    """Scalar Snake objects and food for every game in `env`."""
+    games = []
+    for game in range(env.batch):
+        slots = [(env.head_slot[game] - i) % env.size for i in range(env.length[game])]
+        snake = Snake(0, 0, DIRECTIONS[env.direction[game]])
+        snake.body = [(int(cell) % WIDTH, int(cell) // WIDTH) for cell in env.body[game, slots]]
+        food = int(env.food[game])
+        games.append((snake, (food % WIDTH, food // WIDTH)))
+    return games
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    print('%6s %16s %16s %16s %16s %16s' % ('batch', 'hill climbing', 'batched', 'annealing', 'batched',
+                                             'numpy rng'))
+    for batch in (1, 64, 1024, 4096):
+        env = VecSnakeEnv(batch, WIDTH, HEIGHT, seed=0)
+        for _ in range(60):
+            env.step(vec_local_search.hill_climbing(env))
+        games = snakes(env)
+        seeds = range(batch)
+
+        hill, hill_time = timed(vec_local_search.hill_climbing, env)
+        scalar_hill, scalar_hill_time = timed(lambda: [local_search.hill_climbing(snake, food, WIDTH, HEIGHT)
+                                                       for snake, food in games])
+        annealed, anneal_time = timed(vec_local_search.simulated_annealing, env, [random.Random(s) for s in seeds])
+        _, fast_anneal_time = timed(vec_local_search.simulated_annealing, env, np.random.default_rng(0))
+
+        def scalar_annealing():
+            directions = []
+            for seed, (snake, food) in zip(seeds, games):
+                random.seed(seed)
+                directions.append(local_search.simulated_annealing(snake, food, width=WIDTH, height=HEIGHT))
+            return directions
+        scalar_annealed, scalar_anneal_time = timed(scalar_annealing)
+
+        assert [DIRECTIONS[d] for d in hill] == scalar_hill
+        assert [DIRECTIONS[d] for d in annealed] == scalar_annealed
+        print('%6d %16.0f %16.0f %16.0f %16.0f %16.0f' % (batch, batch / scalar_hill_time, batch / hill_time,
+                                                          batch / scalar_anneal_time, batch / anneal_time,
+                                                          batch / fast_anneal_time))
+
+
+if __name__ == '__main__':
+    main()
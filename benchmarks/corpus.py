@@ -0,0 +1,129 @@
+"""The serialized board states bench_suite.py runs every agent function on.
+
+    python benchmarks/corpus.py
+
+writes them to benchmarks/boards/ (they are checked in, so this is only
+needed after changing the generators below). Each file is one position as
+JSON: the grid, the food and every snake's body, head first:
+
+    {"width": 20, "height": 20, "wrap": false, "food": [3, 7],
+     "snakes": [{"body": [[10, 10], [9, 10]], "direction": [1, 0]}]}
+
+There are four kinds of position, on 20x20, 32x24 and 80x60 grids: a
+one-cell snake on an empty board, a snake coiled over half the board, a
+snake coiled over nine tenths of it, and two snakes coiled against each
+other in the middle of the board (a two-snake melee).
+"""
+
+import json
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from snakecore.board import RIGHT, Board
+from snakecore.engine import Snake
+
+BOARDS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'boards')
+SIZES = ((20, 20), (32, 24), (80, 60))
+KINDS = ('empty', 'coiled', 'near_full', 'melee')
+
+
+def rows_path(left, right, top, bottom, reverse=False):
+    """Cells of the rectangle row by row, turning back at each end (tail first)."""
+    path = []
+    for i, y in enumerate(range(top, bottom)):
+        columns = range(left, right) if (i % 2 == 0) != reverse else range(right - 1, left - 1, -1)
+        path.extend((x, y) for x in columns)
+    return path
+
+
+def snake_state(path, length):
+    """A snake lying along the first `length` cells of `path`, its head on the last of them."""
+    body = path[:length][::-1]
+    if len(body) > 1:
+        direction = (body[0][0] - body[1][0], body[0][1] - body[1][1])
+    else:
+        direction = RIGHT
+    return {'body': [list(cell) for cell in body], 'direction': list(direction)}
+
+
+def make_state(kind, width, height, seed=0):
+    rng = random.Random('%s-%dx%d-%d' % (kind, width, height, seed))
+    size = width * height
+    if kind == 'empty':
+        snakes = [snake_state([(width // 2, height // 2)], 1)]
+    elif kind == 'coiled':
+        snakes = [snake_state(rows_path(0, width, 0, height), size // 2)]
+    elif kind == 'near_full':
+        snakes = [snake_state(rows_path(0, width, 0, height), size * 9 // 10)]
+    elif kind == 'melee':
+        # Two snakes coiled in bands from either side, heads three cells apart in the middle;
+        # an odd number of rows ends both coils at the inner edge
+        top = height // 4
+        rows = height // 4 | 1
+        length = (width // 2 - 1) * rows
+        snakes = [snake_state(rows_path(0, width // 2 - 1, top, top + rows), length),
+                  snake_state(rows_path(width - width // 2 + 1, width, top, top + rows, reverse=True), length)]
+    else:
+        raise ValueError('unknown kind of board: %r' % kind)
+
+    occupied = {tuple(cell) for snake in snakes for cell in snake['body']}
+    free = [(x, y) for y in range(height) for x in range(width) if (x, y) not in occupied]
+    return {'width': width, 'height': height, 'wrap': False, 'food': list(rng.choice(free)), 'snakes': snakes}
+
+
+def board_name(kind, width, height):
+    return '%s-%dx%d' % (kind, width, height)
+
+
+def save_state(state, path):
+    with open(path, 'w') as file:
+        json.dump(state, file, separators=(',', ':'))
+        file.write('\n')
+
+
+def load_state(path):
+    with open(path) as file:
+        return json.load(file)
+
+
+class Position:
+    """A loaded state as the agent functions take it: a Board with the snakes on it, Snakes and the food."""
+
+    def __init__(self, state):
+        self.width = state['width']
+        self.height = state['height']
+        self.wrap = state['wrap']
+        self.food = tuple(state['food'])
+        self.snakes = []
+        for entry in state['snakes']:
+            snake = Snake(*entry['body'][0], direction=tuple(entry['direction']))
+            snake.body = [tuple(cell) for cell in entry['body']]
+            self.snakes.append(snake)
+        self.board = Board(self.width, self.height, self.wrap)
+        for snake in self.snakes:
+            self.board.place(snake.body)
+
+
+def load_corpus(boards_dir=BOARDS_DIR):
+    """{name: Position} for every board in `boards_dir`, in name order."""
+    corpus = {}
+    for filename in sorted(os.listdir(boards_dir)):
+        if filename.endswith('.json'):
+            corpus[filename[:-len('.json')]] = Position(load_state(os.path.join(boards_dir, filename)))
+    return corpus
+
+
+def main():
+    os.makedirs(BOARDS_DIR, exist_ok=True)
+    for width, height in SIZES:
+        for kind in KINDS:
+            name = board_name(kind, width, height)
+            save_state(make_state(kind, width, height), os.path.join(BOARDS_DIR, name + '.json'))
+            print(name)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,9 @@
+"""Headless Snake engine and the AI agents from the game scripts.
+
+Nothing in here imports pygame; see `snakecore.render` for the window.
+"""
+
+from .agents import (AGENTS, HamiltonianAgent, LocalSearchAgent, MCTSAgent, MinimaxAgent, SearchAgent,
+                     SimultaneousAgent)
+from .engine import (CRASH, DIRECTIONS, DOWN, FULL, LEFT, RIGHT, TIMEOUT, UP, Observation, Observer, Snake,
+                     SnakeEngine)
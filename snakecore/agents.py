@@ -0,0 +1,209 @@
+"""Adapters that let the existing AI functions drive a SnakeEngine.
+
+An agent is any callable `agent(observation, index)` returning the direction
+for snake `index`. Agents that keep state between moves also have `reset()`.
+The agents here also add the work each move takes to `stats`, a SearchStats
+(see snakecore.instrument). Agents that draw random numbers draw them from
+`rng`, their own random.Random; a game runner that wants reproducible games
+replaces it with one of the game's streams (SnakeEngine.stream).
+"""
+
+import inspect
+import random
+import time
+
+from . import search
+from .distance import distance_field
+from .hamiltonian import HamiltonianAgent
+from .instrument import SearchStats
+from .local_search import fast_simulated_annealing, hill_climbing, simulated_annealing
+from .mcts import MCTSAgent
+from .minimax import AISnake, VECTORS
+from .planner import PathPlanner
+from .simultaneous import JointSearch
+from .territory import RegionCache
+from .transposition import TranspositionTable
+
+
+class SearchAgent:
+    """Follows a bfs/ucs/astar/dfs path to the food, reusing it while it stays clear.
+
+    With `safe` it only takes paths that leave it a way back to its tail (see
+    PathPlanner) and chases its tail otherwise.
+    """
+
+    def __init__(self, search_function, trace=False, safe=False):
+        self.planner = PathPlanner(search_function, trace, safe)
+        self.board = None
+
+    def reset(self):
+        self.planner.reset()
+
+    @property
+    def path(self):
+        # Cells still ahead of the snake, nearest first, for highlighting
+        if self.board is None:
+            return []
+        return [self.board.xy(cell) for cell in reversed(self.planner.cells)]
+
+    @property
+    def stats(self):
+        return self.planner.stats
+
+    @property
+    def explored(self):
+        # Bitmap of the cells the last search explored, or None when not tracing
+        return self.planner.trace
+
+    def __call__(self, obs, index=0):
+        snake = obs.snakes[index]
+        self.board = board = obs.board
+        direction = self.planner.next_move(board, board.cell(*snake.head), board.cell(*obs.food), snake.body)
+        return snake.direction if direction is None else direction
+
+
+class LocalSearchAgent:
+    """Wraps hill_climbing or simulated_annealing.
+
+    With `distance_field` the policy scores moves by path distance to the
+    food, read from the board's shared DistanceField.
+    """
+
+    def __init__(self, policy, distance_field=False, seed=None):
+        self.policy = policy
+        self.distance_field = distance_field
+        self.stats = SearchStats()
+        self.rng = random.Random(seed)
+        self.draws = 'rng' in inspect.signature(policy).parameters
+
+    def reset(self):
+        pass
+
+    def __call__(self, obs, index=0):
+        options = {'stats': self.stats}
+        if self.draws:
+            options['rng'] = self.rng
+        if self.distance_field:
+            options['distances'] = distance_field(obs.board, obs.board.cell(*obs.food)).distances
+        return self.policy(obs.snakes[index], obs.food, width=obs.width, height=obs.height, **options)
+
+
+class MinimaxAgent:
+    """Runs AISnake.get_best_move against the other snake (or nobody).
+
+    The transposition table is kept from move to move, since the positions
+    searched on one tick are mostly searched again on the next. With a
+    `time_budget` (milliseconds per move) the search deepens iteratively up
+    to `depth` and stops when the budget is spent. With `distance_field` the
+    evaluator uses path distance to the food instead of Manhattan distance.
+    """
+
+    def __init__(self, depth=2, time_budget=None, table_bits=16, territory=False, move_ordering=True,
+                 distance_field=False, seed=None):
+        self.depth = depth
+        self.time_budget = time_budget
+        self.table = TranspositionTable(table_bits)
+        self.territory = territory
+        self.move_ordering = move_ordering
+        self.distance_field = distance_field
+        self.regions = RegionCache()
+        self.workspace = None
+        self.stats = SearchStats()
+        self.rng = random.Random(seed)
+
+    def reset(self):
+        self.table.clear()
+        self.regions.clear()
+
+    def __call__(self, obs, index=0):
+        started = time.perf_counter()
+        snake = obs.snakes[index]
+        opponents = [other for other in obs.snakes if other is not snake]
+        opponent = opponents[0] if opponents else _NoOpponent()
+        distances = None
+        if self.distance_field:
+            distances = distance_field(obs.board, obs.board.cell(*obs.food)).distances
+        ai = AISnake(snake, opponent, obs.food, obs.width, obs.height, obs.wrap, table=self.table,
+                     territory=self.territory, regions=self.regions, move_ordering=self.move_ordering,
+                     distances=distances, rng=self.rng, workspace=self.workspace)
+        move = ai.get_best_move(self.depth, self.time_budget, started)
+        self.workspace = ai.workspace
+        self.stats.add(ai.nodes, 0, ai.completed_depth)
+        return VECTORS[move]
+
+
+class SimultaneousAgent:
+    """Picks both snakes' moves for a tick with one JointSearch.
+
+    Use the same agent for both snakes: the search for snake 0 also decides
+    snake 1's move, which is handed out when snake 1 asks for the same tick.
+    `depth` counts ticks, in which both snakes move, so depth 1 looks as far
+    ahead as MinimaxAgent at depth 2.
+    """
+
+    def __init__(self, depth=1, time_budget=None, solver='maximin', territory=False, seed=None):
+        self.depth = depth
+        self.time_budget = time_budget
+        self.solver = solver
+        self.territory = territory
+        self.regions = RegionCache()
+        self.planned = {}
+        self.workspace = None
+        self.stats = SearchStats()
+        self.rng = random.Random(seed)
+
+    def reset(self):
+        self.regions.clear()
+        self.planned.clear()
+
+    def __call__(self, obs, index=0):
+        started = time.perf_counter()
+        key = (obs.steps, obs.food, tuple(snake.head for snake in obs.snakes))
+        planned = self.planned.pop((key, index), None)
+        if planned is not None:
+            return planned
+        self.planned.clear()
+
+        snake = obs.snakes[index]
+        opponents = [other for other in obs.snakes if other is not snake]
+        opponent = opponents[0] if opponents else _NoOpponent()
+        search = JointSearch(snake, opponent, obs.food, obs.width, obs.height, obs.wrap, self.solver,
+                             territory=self.territory, regions=self.regions, rng=self.rng,
+                             workspace=self.workspace)
+        move, opponent_move = search.get_best_moves(self.depth, self.time_budget, started)
+        self.workspace = search.workspace
+        self.stats.add(search.nodes, 0, search.completed_depth)
+        if opponent_move is not None:
+            self.planned[(key, obs.snakes.index(opponent))] = VECTORS[opponent_move]
+        return VECTORS[move]
+
+
+class _NoOpponent:
+    # Stand-in for single-snake games: an opponent without a body never moves
+    def __init__(self):
+        self.body = []
+
+
+AGENTS = {
+    'bfs': lambda: SearchAgent(search.bfs),
+    'ucs': lambda: SearchAgent(search.ucs),
+    'astar': lambda: SearchAgent(search.astar),
+    'astar_field': lambda: SearchAgent(search.field_astar),
+    'dfs': lambda: SearchAgent(search.dfs),
+    'bfs_safe': lambda: SearchAgent(search.bfs, safe=True),
+    'ucs_safe': lambda: SearchAgent(search.ucs, safe=True),
+    'astar_safe': lambda: SearchAgent(search.astar, safe=True),
+    'dfs_safe': lambda: SearchAgent(search.dfs, safe=True),
+    'hill_climbing': lambda: LocalSearchAgent(hill_climbing),
+    'simulated_annealing': lambda: LocalSearchAgent(simulated_annealing),
+    'simulated_annealing_fast': lambda: LocalSearchAgent(fast_simulated_annealing),
+    'hill_climbing_field': lambda: LocalSearchAgent(hill_climbing, distance_field=True),
+    'simulated_annealing_field': lambda: LocalSearchAgent(fast_simulated_annealing, distance_field=True),
+    'minimax': MinimaxAgent,
+    'minimax_territory': lambda: MinimaxAgent(territory=True),
+    'minimax_field': lambda: MinimaxAgent(distance_field=True),
+    'simultaneous': SimultaneousAgent,
+    'simultaneous_regret': lambda: SimultaneousAgent(solver='regret'),
+    'mcts': MCTSAgent,
+    'hamiltonian': HamiltonianAgent,
+}
@@ -0,0 +1,239 @@
+"""Compact board model: integer cells, an occupancy bytearray and ring-buffer bodies.
+
+Cell `c` is the square at (c % width, c // width). Occupancy is a count per
+cell, so "is this square free?" is one bytearray lookup no matter how long
+the snakes are, and moving a RingBody is O(1).
+"""
+
+from array import array
+from functools import lru_cache
+
+# Directions as (dx, dy) steps on the grid
+UP = (0, -1)
+DOWN = (0, 1)
+LEFT = (-1, 0)
+RIGHT = (1, 0)
+DIRECTIONS = [UP, DOWN, LEFT, RIGHT]
+DIRECTION_INDEX = {direction: d for d, direction in enumerate(DIRECTIONS)}
+
+OFF_GRID = -1
+
+
+@lru_cache(maxsize=None)
+def step_tables(width, height, wrap):
+    """steps[d][cell] is the cell one move from `cell` in DIRECTIONS[d], or OFF_GRID."""
+    steps = []
+    for dx, dy in DIRECTIONS:
+        table = array('i', [OFF_GRID]) * (width * height)
+        for y in range(height):
+            for x in range(width):
+                nx, ny = x + dx, y + dy
+                if wrap:
+                    nx, ny = nx % width, ny % height
+                if 0 <= nx < width and 0 <= ny < height:
+                    table[y * width + x] = ny * width + nx
+        steps.append(table)
+    return steps
+
+
+@lru_cache(maxsize=None)
+def neighbor_table(width, height, wrap):
+    """neighbors[cell] lists (d, next cell) for every on-grid move DIRECTIONS[d] from `cell`."""
+    steps = step_tables(width, height, wrap)
+    return [tuple((d, steps[d][cell]) for d in range(4) if steps[d][cell] != OFF_GRID)
+            for cell in range(width * height)]
+
+
+class Board:
+    def __init__(self, width, height, wrap=False):
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self.wrap = wrap
+        self.occupied = bytearray(self.size)
+        self.free = self.size  # cells with nothing on them, kept up to date by occupy/vacate
+        self.version = 0  # bumped by every occupy/vacate, so caches can tell the board changed
+        self.steps = step_tables(width, height, wrap)
+        self.neighbors = neighbor_table(width, height, wrap)
+        self.distance_field = None  # the DistanceField shared by agents reading this board
+        self.search_buffers = None  # the parent and move arrays the searches reuse (see search.py)
+
+    def cell(self, x, y):
+        return y * self.width + x
+
+    def xy(self, cell):
+        return (cell % self.width, cell // self.width)
+
+    def contains(self, x, y):
+        return 0 <= x < self.width and 0 <= y < self.height
+
+    def occupy(self, cell):
+        if not self.occupied[cell]:
+            self.free -= 1
+        self.occupied[cell] += 1
+        self.version += 1
+
+    def vacate(self, cell):
+        self.version += 1
+        self.occupied[cell] -= 1
+        if not self.occupied[cell]:
+            self.free += 1
+
+    def place(self, positions):
+        """Marks a list of (x, y) positions as occupied and returns their cells."""
+        cells = []
+        for x, y in positions:
+            if self.contains(x, y):
+                cell = y * self.width + x
+                self.occupy(cell)
+                cells.append(cell)
+        return cells
+
+
+class FreeCells:
+    """The free cells of a board as a set with O(1) add, discard and random choice.
+
+    The cells are packed at the front of `cells`, in no particular order, and
+    `index[cell]` is where `cell` sits in it (or -1 when it is not free).
+    Discarding moves the last free cell into the hole, so nothing is ever
+    shifted and choice() is a single randrange.
+    """
+
+    def __init__(self, board):
+        self.cells = array('i', [cell for cell in range(board.size) if not board.occupied[cell]])
+        self.count = len(self.cells)
+        self.cells.extend(array('i', [0]) * (board.size - self.count))
+        self.index = array('i', [-1]) * board.size
+        for i in range(self.count):
+            self.index[self.cells[i]] = i
+
+    def __len__(self):
+        return self.count
+
+    def __contains__(self, cell):
+        return self.index[cell] >= 0
+
+    def add(self, cell):
+        if self.index[cell] < 0:
+            self.cells[self.count] = cell
+            self.index[cell] = self.count
+            self.count += 1
+
+    def discard(self, cell):
+        i = self.index[cell]
+        if i >= 0:
+            self.count -= 1
+            last = self.cells[self.count]
+            self.cells[i] = last
+            self.index[last] = i
+            self.index[cell] = -1
+
+    def choice(self, rng):
+        """A random free cell, or OFF_GRID when there is none."""
+        if not self.count:
+            return OFF_GRID
+        return self.cells[rng.randrange(self.count)]
+
+
+class RingBody:
+    """A snake body stored as cell indices in a fixed-size ring buffer, head first.
+
+    Every cell in the body is counted in `board.occupied`, which is how
+    collisions are tested; the ring itself only remembers the order. `cells`
+    counts this snake's own segments per cell, to tell the snakes apart.
+    With `placed` the positions are already counted on the board (a copy of
+    a game board, say) and are not counted again.
+    """
+
+    def __init__(self, board, positions, placed=False):
+        self.board = board
+        self.capacity = board.size + 1
+        self.buffer = array('i', [0]) * self.capacity
+        self.cells = bytearray(board.size)
+        self.start = 0
+        self.length = 0
+        for x, y in reversed(positions):
+            if board.contains(x, y):
+                cell = y * board.width + x
+                self.push(cell)
+                if placed:
+                    board.vacate(cell)
+
+    def load(self, cells):
+        """Makes the body `cells` (a list of cell indices, head first), replacing the old one.
+
+        Neither the old body nor the new one is counted on the board: the
+        caller clears the board first and sets `board.free` once every body
+        is loaded. Much faster than pushing the cells one at a time.
+        """
+        self.start = 0
+        self.length = len(cells)
+        self.buffer[:self.length] = array('i', cells)
+        own, occupied = self.cells, self.board.occupied
+        own[:] = bytes(len(own))
+        for cell in cells:
+            own[cell] += 1
+            occupied[cell] += 1
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        buffer, capacity = self.buffer, self.capacity
+        for i in range(self.start, self.start + self.length):
+            yield buffer[i % capacity]
+
+    @property
+    def head(self):
+        return self.buffer[self.start]
+
+    @property
+    def neck(self):
+        """The segment right behind the head (OFF_GRID for a one-cell body)."""
+        if self.length < 2:
+            return OFF_GRID
+        return self.buffer[(self.start + 1) % self.capacity]
+
+    @property
+    def tail(self):
+        return self.buffer[(self.start + self.length - 1) % self.capacity]
+
+    def push(self, cell):
+        self.start = (self.start - 1) % self.capacity
+        self.buffer[self.start] = cell
+        self.length += 1
+        self.cells[cell] += 1
+        self.board.occupy(cell)
+
+    def pop_head(self):
+        cell = self.buffer[self.start]
+        self.start = (self.start + 1) % self.capacity
+        self.length -= 1
+        self.cells[cell] -= 1
+        self.board.vacate(cell)
+        return cell
+
+    def pop(self):
+        cell = self.tail
+        self.length -= 1
+        self.cells[cell] -= 1
+        self.board.vacate(cell)
+        return cell
+
+    def append(self, cell):
+        self.buffer[(self.start + self.length) % self.capacity] = cell
+        self.length += 1
+        self.cells[cell] += 1
+        self.board.occupy(cell)
+
+    def move(self, cell, grow=False):
+        """Moves the head to `cell`; returns the tail cell that was freed, or OFF_GRID."""
+        tail = OFF_GRID if grow else self.pop()
+        self.push(cell)
+        return tail
+
+    def undo_move(self, tail):
+        """Reverses the move() that returned `tail`."""
+        self.pop_head()
+        if tail != OFF_GRID:
+            self.append(tail)
@@ -0,0 +1,67 @@
+"""Shortest-path distances from the food, for every cell, from one BFS.
+
+Straight-line distance (Euclidean in hill climbing, simulated annealing and
+A*, Manhattan in the minimax evaluator) ignores the snakes in the way. A
+DistanceField runs one breadth-first search outward from the food through
+the free cells and keeps the number of moves to the food for every cell in
+a flat array, so any agent reads the true distance of a cell with one index.
+
+Occupied cells get a distance too when they touch the searched area (the
+moves to the food after stepping off them, plus one) but are not searched
+through; that is what gives a snake's head its distance. Cells with no path
+to the food hold `unreachable`, one more than the longest possible path.
+
+The field is only recomputed when the food moves or the board changes
+(Board.version), and distance_field() keeps one per board, so every agent
+looking at the same engine board in the same tick shares one search.
+"""
+
+from array import array
+
+
+class DistanceField:
+    def __init__(self, board):
+        self.unreachable = board.size
+        self.blank = array('i', [self.unreachable]) * board.size
+        self.distances = array('i', self.blank)
+        self.food = None
+        self.version = None
+        self.searches = 0
+
+    def update(self, board, food):
+        """Makes the field current for `board` and the food at cell `food`."""
+        if food == self.food and board.version == self.version:
+            return self
+        self.food = food
+        self.version = board.version
+        self.searches += 1
+
+        unreachable = self.unreachable
+        distances = self.distances
+        distances[:] = self.blank
+        occupied = board.occupied
+        neighbors = board.neighbors
+        distances[food] = 0
+        frontier = [food]
+        distance = 0
+        while frontier:
+            distance += 1
+            next_frontier = []
+            for cell in frontier:
+                for _, next_cell in neighbors[cell]:
+                    if distances[next_cell] == unreachable:
+                        distances[next_cell] = distance
+                        if not occupied[next_cell]:
+                            next_frontier.append(next_cell)
+            frontier = next_frontier
+        return self
+
+    def reachable(self, cell):
+        return self.distances[cell] != self.unreachable
+
+
+def distance_field(board, food):
+    """The board's shared DistanceField, brought up to date for the food at cell `food`."""
+    if board.distance_field is None:
+        board.distance_field = DistanceField(board)
+    return board.distance_field.update(board, food)
@@ -0,0 +1,216 @@
+"""Headless Snake engine shared by every game script.
+
+The engine only knows about grid cells, snakes and food, so it never touches
+pygame and runs as fast as the agents driving it. Windows, recorders and the
+like attach as observers.
+"""
+
+import random
+from collections import Counter, deque, namedtuple
+
+from .board import DIRECTIONS, DOWN, LEFT, RIGHT, UP, Board, FreeCells
+
+Observation = namedtuple('Observation', 'width height wrap food snakes steps board')
+
+# How a game ended (SnakeEngine.outcome)
+CRASH = 'crash'  # a snake died
+FULL = 'full'  # the snakes filled the board, so there is nowhere left for food
+TIMEOUT = 'timeout'  # max_steps moves were played
+
+
+class Snake:
+    """A snake's body as a deque of (x, y) cells, head first, and how many segments sit on each cell.
+
+    move() adds the head and drops the tail in O(1) and keeps `cells` up to
+    date, so "is this cell part of me?" never scans the body either. Setting
+    `body` (to any sequence of cells) rebuilds both and sets `length`.
+    """
+
+    def __init__(self, x, y, direction=RIGHT):
+        self.body = [(x, y)]
+        self.direction = direction
+        self.score = 0
+        self.alive = True
+
+    @property
+    def body(self):
+        return self._body
+
+    @body.setter
+    def body(self, positions):
+        self._body = deque(positions)
+        self.cells = Counter(self._body)
+        self.length = len(self._body)
+
+    @property
+    def head(self):
+        return self._body[0]
+
+    @property
+    def tail(self):
+        return self._body[-1]
+
+    def move(self, new_head):
+        """Puts the head on `new_head`; returns the tail cell left behind, or None while the snake grows."""
+        body, cells = self._body, self.cells
+        body.appendleft(new_head)
+        cells[new_head] = cells.get(new_head, 0) + 1
+        if len(body) <= self.length:
+            return None
+        tail = body.pop()
+        if cells[tail] > 1:
+            cells[tail] -= 1
+        else:
+            del cells[tail]
+        return tail
+
+    def collides(self, cell):
+        """Whether a head moving onto `cell` runs into this body; the tail moves out of the way first."""
+        count = self.cells.get(cell, 0)
+        return count > 1 or (count == 1 and cell != self._body[-1])
+
+
+class Observer:
+    """Base class for anything that wants to watch a game (renderers, loggers)."""
+
+    def on_reset(self, engine):
+        pass
+
+    def on_step(self, engine):
+        pass
+
+
+class SnakeEngine:
+    """Grid Snake for one or more snakes that all move at the same time.
+
+    Positions are integer (x, y) grid cells. `board` counts how many snake
+    segments sit on every cell and is kept up to date move by move, so
+    collision tests and agents never have to scan a body.
+
+    `starts` is a list of (x, y, direction) tuples, one per snake. A snake dies
+    when its head leaves the grid (unless `wrap` is set), runs into its own body
+    or runs into another snake. The game is over as soon as any snake dies, the
+    snakes fill the board or `max_steps` moves have been played, and
+    `outcome` then says which (CRASH, FULL or TIMEOUT; None until then).
+
+    `free_cells` holds the empty cells and is updated with every move, so
+    food is one random pick however full the board is. A board with no free
+    cell left has no food to spawn: the game ends FULL, with the food left on
+    the cell where it was eaten.
+
+    Every game has its own seed, `seed`: the one passed to reset(), or else
+    the next from a stream seeded by the engine's `seed`, so the first game
+    of SnakeEngine(seed=s) is seeded with s. Food comes from `rng`, seeded
+    with it, and stream(name) gives agents their own generators for the
+    game. A game is therefore fixed by its seed and the moves played, which
+    is what snakecore.replay records.
+    """
+
+    def __init__(self, width, height, starts=None, wrap=False, max_steps=None, seed=None):
+        self.width = width
+        self.height = height
+        self.starts = starts or [(width // 2, height // 2, RIGHT)]
+        self.wrap = wrap
+        self.max_steps = max_steps
+        self.seeds = random.Random(seed)
+        self.observers = []
+        self.reset(seed)
+
+    def add_observer(self, observer):
+        self.observers.append(observer)
+
+    def reset(self, seed=None):
+        if seed is None:
+            seed = self.seeds.getrandbits(63)
+        self.seed = seed
+        self.rng = random.Random(seed)
+        self.snakes = [Snake(x, y, direction) for x, y, direction in self.starts]
+        self.board = Board(self.width, self.height, self.wrap)
+        for snake in self.snakes:
+            self.board.place(snake.body)
+        self.free_cells = FreeCells(self.board)
+        self.steps = 0
+        self.done = False
+        self.outcome = None
+        self.food = self.spawn_food()
+        if self.food is None:
+            self.done = True
+            self.outcome = FULL
+        for observer in self.observers:
+            observer.on_reset(self)
+        return self.observe()
+
+    def stream(self, name):
+        """A random.Random for `name` (an agent, say) that depends only on this game's seed and `name`."""
+        return random.Random('%d:%s' % (self.seed, name))
+
+    def observe(self):
+        # The snakes are shared, not copied: agents must treat them as read-only
+        return Observation(self.width, self.height, self.wrap, self.food, self.snakes, self.steps, self.board)
+
+    def in_bounds(self, cell):
+        return 0 <= cell[0] < self.width and 0 <= cell[1] < self.height
+
+    def next_cell(self, cell, direction):
+        x, y = cell[0] + direction[0], cell[1] + direction[1]
+        if self.wrap:
+            return (x % self.width, y % self.height)
+        return (x, y)
+
+    def spawn_food(self):
+        """A random free (x, y) cell, or None when the board is full."""
+        if not self.free_cells:
+            return None
+        return self.board.xy(self.free_cells.choice(self.rng))
+
+    def step(self, actions):
+        """Move every snake one cell; `actions` holds one direction (or None) per snake.
+
+        Returns True once the game is over.
+        """
+        if self.done:
+            return True
+        self.steps += 1
+
+        board = self.board
+        free_cells = self.free_cells
+        eaten = False
+        for snake, action in zip(self.snakes, actions):
+            if action is not None:
+                snake.direction = action
+            new_head = self.next_cell(snake.head, snake.direction)
+            if new_head == self.food:
+                snake.length += 1
+                snake.score += 1
+                eaten = True
+            tail = snake.move(new_head)
+            if self.in_bounds(new_head):
+                cell = board.cell(*new_head)
+                board.occupy(cell)
+                free_cells.discard(cell)
+            if tail is not None:
+                cell = board.cell(*tail)
+                board.vacate(cell)
+                if not board.occupied[cell]:
+                    free_cells.add(cell)
+
+        # Tails have already moved out of the way, so following your own tail is safe.
+        # Any other segment on the head's cell, ours or the other snake's, is a crash.
+        for snake in self.snakes:
+            head = snake.head
+            if not self.in_bounds(head) or board.occupied[board.cell(*head)] > 1:
+                snake.alive = False
+
+        if not all(snake.alive for snake in self.snakes):
+            self.outcome = CRASH
+        elif not free_cells:
+            self.outcome = FULL
+        elif self.max_steps is not None and self.steps >= self.max_steps:
+            self.outcome = TIMEOUT
+        self.done = self.outcome is not None
+        if eaten and not self.done:
+            self.food = self.spawn_food()
+
+        for observer in self.observers:
+            observer.on_step(self)
+        return self.done
@@ -0,0 +1,145 @@
+"""Hamiltonian-cycle agent: never traps itself, and takes shortcuts when they are safe.
+
+A Hamiltonian cycle visits every cell of the grid once and returns to the
+start, so a snake that follows it can grow until it fills the board. The
+cycle is computed once per grid size and cached on disk as the position of
+every cell along it (`order`).
+
+Following the cycle keeps the whole body on the stretch of the cycle that
+runs from the tail to the head, and everything from the head onward to the
+tail free. Any neighbor of the head that lies on that free stretch is safe
+to jump to, so the agent takes the one furthest along that does not skip
+past the food. Each move looks at four neighbors: O(1) however long the
+snake is.
+
+This is a single-snake agent; another snake on the board breaks the
+invariant, and the agent then only avoids occupied cells. A grid with both
+sides odd has no Hamiltonian cycle; there the agent plays safe-mode BFS
+(see planner.py) instead.
+"""
+
+import os
+from array import array
+from functools import lru_cache
+
+from .board import DIRECTIONS
+from .instrument import SearchStats
+from .planner import PathPlanner
+from .search import bfs
+
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'snakecore')
+
+
+def has_cycle(width, height):
+    return min(width, height) >= 2 and (width % 2 == 0 or height % 2 == 0)
+
+
+def build_cycle(width, height):
+    """order[cell] for a Hamiltonian cycle of the grid; one side must be even.
+
+    With an even height the cycle runs along the top row, zigzags down
+    through columns 1 to width-1 and comes back up column 0. An odd height
+    with an even width is the same cycle transposed.
+    """
+    if height % 2 and width % 2:
+        raise ValueError('a %dx%d grid has no Hamiltonian cycle: one side must be even' % (width, height))
+    if min(width, height) < 2:
+        raise ValueError('a Hamiltonian cycle needs a grid at least 2 cells wide and high')
+    transposed = height % 2 == 1
+    columns, rows = (height, width) if transposed else (width, height)
+
+    path = [(x, 0) for x in range(columns)]
+    for y in range(1, rows):
+        path.extend((x, y) for x in (range(columns - 1, 0, -1) if y % 2 else range(1, columns)))
+    path.extend((0, y) for y in range(rows - 1, 0, -1))
+
+    order = array('i', [0]) * (width * height)
+    for index, (x, y) in enumerate(path):
+        if transposed:
+            x, y = y, x
+        order[y * width + x] = index
+    return order
+
+
+@lru_cache(maxsize=None)
+def cycle_order(width, height, cache_dir=CACHE_DIR):
+    """build_cycle, loaded from (or saved to) `cache_dir` when it can be."""
+    path = os.path.join(cache_dir, 'hamiltonian-%dx%d.bin' % (width, height))
+    order = array('i')
+    try:
+        with open(path, 'rb') as cache:
+            order.fromfile(cache, width * height)
+        return order
+    except (OSError, EOFError):
+        pass
+    order = build_cycle(width, height)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(path + '.tmp', 'wb') as cache:
+            order.tofile(cache)
+        os.replace(path + '.tmp', path)
+    except OSError:
+        pass  # A read-only home only costs rebuilding the cycle next time
+    return order
+
+
+class HamiltonianAgent:
+    """Follows the grid's Hamiltonian cycle, cutting ahead toward the food when it is safe.
+
+    `shortcuts` counts the moves that skipped part of the cycle. On a grid
+    without a cycle the moves come from `planner`, a safe-mode BFS PathPlanner.
+    """
+
+    def __init__(self, cache_dir=CACHE_DIR):
+        self.cache_dir = cache_dir
+        self.shortcuts = 0
+        self.stats = SearchStats()
+        self.planner = PathPlanner(bfs, safe=True)
+        self.planner.stats = self.stats
+
+    def reset(self):
+        self.planner.reset()
+
+    def without_cycle(self, obs, snake):
+        board = obs.board
+        head = board.cell(*snake.head)
+        direction = self.planner.next_move(board, head, board.cell(*obs.food), snake.body)
+        if direction is not None:
+            return direction
+        for d, cell in board.neighbors[head]:
+            if not board.occupied[cell]:
+                return DIRECTIONS[d]
+        return snake.direction
+
+    def __call__(self, obs, index=0):
+        board = obs.board
+        snake = obs.snakes[index]
+        if not has_cycle(obs.width, obs.height):
+            return self.without_cycle(obs, snake)
+        order = cycle_order(obs.width, obs.height, self.cache_dir)
+        size = board.size
+        head = board.cell(*snake.head)
+        tail = board.cell(*snake.body[-1])
+        here = order[head]
+
+        # How far along the cycle the tail and the food are; only the head
+        # and tail share a cell when the snake is one cell long
+        room = (order[tail] - here) % size or size
+        food = (order[board.cell(*obs.food)] - here) % size
+
+        occupied = board.occupied
+        self.stats.add(len(board.neighbors[head]), 0, 1)
+        best, best_ahead = None, 0
+        fallback = None
+        for d, cell in board.neighbors[head]:
+            ahead = (order[cell] - here) % size
+            if best_ahead < ahead < room and ahead <= food and not occupied[cell]:
+                best, best_ahead = d, ahead
+            elif (ahead == 1 and (not occupied[cell] or cell == tail)) or (fallback is None and not occupied[cell]):
+                # The next cell on the cycle is free or the tail, which moves out of the way
+                fallback = d
+        if best is None:
+            return snake.direction if fallback is None else DIRECTIONS[fallback]
+        if best_ahead > 1:
+            self.shortcuts += 1
+        return DIRECTIONS[best]
@@ -0,0 +1,223 @@
+"""Per-decision measurements for the agents: time, work done and memory.
+
+Every search fills in a SearchStats it is handed (`stats=`): the nodes it
+expanded, the largest its frontier grew and the depth it reached. Searches
+without a frontier (minimax, local search) leave that at 0, and a decision
+that runs several searches adds them up. The agents keep one SearchStats
+each, as `agent.stats`.
+
+InstrumentedAgent wraps any agent, times each decision and copies its stats
+into a DecisionLog, a fixed-size ring buffer of the most recent decisions
+that turns them into percentiles and histograms. With `allocations=N` every
+Nth decision also runs under tracemalloc and records the peak bytes it
+allocated. Tracing slows Python down several times, which inflates the
+times of the traced decisions; sampling keeps the rest honest.
+"""
+
+import bisect
+import time
+import tracemalloc
+from array import array
+
+FIELDS = ('time', 'nodes', 'frontier', 'depth', 'allocated')
+
+# Histogram bucket upper edges: quarter octaves of microseconds for time (up to about 16 s),
+# powers of two for the rest (bytes for allocations)
+TIME_EDGES = tuple(round(2 ** (i / 4.0), 3) for i in range(97))
+COUNT_EDGES = tuple(2 ** i for i in range(40))
+
+
+class SearchStats:
+    """Work done by one decision."""
+
+    __slots__ = ('nodes', 'frontier_peak', 'depth')
+
+    def __init__(self):
+        self.clear()
+
+    def clear(self):
+        self.nodes = 0
+        self.frontier_peak = 0
+        self.depth = 0
+
+    def add(self, nodes, frontier_peak=0, depth=0):
+        self.nodes += nodes
+        self.frontier_peak = max(self.frontier_peak, frontier_peak)
+        self.depth = max(self.depth, depth)
+
+
+class DecisionLog:
+    """The last `capacity` decisions, one array per field.
+
+    `decisions`, `total_time` and `worst_time` cover every decision ever
+    recorded; the percentiles and histograms only the ones still in the ring.
+    Allocations are -1 for decisions that were not traced.
+    """
+
+    def __init__(self, capacity=4096):
+        self.capacity = capacity
+        self.columns = {'time': array('d', [0.0]) * capacity}
+        for field in FIELDS[1:]:
+            self.columns[field] = array('q', [0]) * capacity
+        self.filled = 0  # decisions held in the ring
+        self.slot = 0  # where the next one goes
+        self.decisions = 0
+        self.total_time = 0.0
+        self.worst_time = 0.0
+
+    def __len__(self):
+        return self.filled
+
+    def record(self, seconds, stats=None, allocated=-1):
+        slot = self.slot
+        columns = self.columns
+        columns['time'][slot] = seconds
+        if stats is not None:
+            columns['nodes'][slot] = stats.nodes
+            columns['frontier'][slot] = stats.frontier_peak
+            columns['depth'][slot] = stats.depth
+        else:
+            columns['nodes'][slot] = columns['frontier'][slot] = columns['depth'][slot] = 0
+        columns['allocated'][slot] = allocated
+        self.advance(seconds)
+
+    def advance(self, seconds):
+        self.slot = (self.slot + 1) % self.capacity
+        self.filled = min(self.filled + 1, self.capacity)
+        self.decisions += 1
+        self.total_time += seconds
+        if seconds > self.worst_time:
+            self.worst_time = seconds
+
+    def merge(self, other):
+        """Adds `other`'s decisions to this log (the ring keeps the latest of them)."""
+        for i in range(other.slot - other.filled, other.slot):
+            for field, column in self.columns.items():
+                column[self.slot] = other.columns[field][i % other.capacity]
+            self.advance(0.0)
+        # The running totals also cover decisions `other` no longer holds
+        self.decisions += other.decisions - other.filled
+        self.total_time += other.total_time
+        self.worst_time = max(self.worst_time, other.worst_time)
+
+    def values(self, field):
+        """The recorded values of `field`, in no particular order (untraced allocations left out)."""
+        values = self.columns[field][:self.filled]
+        if field == 'allocated':
+            return [value for value in values if value >= 0]
+        return values.tolist()
+
+    def percentile(self, field, q):
+        """Nearest-rank `q`th percentile of `field`, or None with nothing recorded."""
+        values = sorted(self.values(field))
+        if not values:
+            return None
+        return values[min(len(values) - 1, max(0, -(-len(values) * q // 100) - 1))]
+
+    def histogram(self, field, edges=None):
+        """[(upper edge, count)] for the non-empty buckets; time is bucketed in microseconds.
+
+        The last bucket (upper edge None) holds everything above the last edge.
+        Histograms with the same edges add up across logs and processes (see
+        merge_histograms), unlike the ring itself.
+        """
+        if edges is None:
+            edges = TIME_EDGES if field == 'time' else COUNT_EDGES
+        scale = 1e6 if field == 'time' else 1
+        counts = [0] * (len(edges) + 1)
+        for value in self.values(field):
+            counts[bisect.bisect_left(edges, value * scale)] += 1
+        return [(edge, count) for edge, count in zip(list(edges) + [None], counts) if count]
+
+    def summary(self):
+        """{field: {'p50', 'p99', 'max', 'mean'}} for the fields that were recorded; time in seconds."""
+        summary = {}
+        for field in FIELDS:
+            values = self.values(field)
+            if not values:
+                continue
+            summary[field] = {'p50': self.percentile(field, 50), 'p99': self.percentile(field, 99),
+                              'max': max(values), 'mean': sum(values) / len(values)}
+        return summary
+
+    def export(self):
+        """Summary and histograms as plain dicts and lists, ready for json.dump."""
+        return {'decisions': self.decisions, 'total_time': self.total_time, 'worst_time': self.worst_time,
+                'summary': self.summary(),
+                'histograms': {field: self.histogram(field) for field in FIELDS if self.values(field)}}
+
+
+def merge_histograms(histograms):
+    """Adds up histograms made with the same edges."""
+    counts = {}
+    for histogram in histograms:
+        for edge, count in histogram:
+            counts[edge] = counts.get(edge, 0) + count
+    # None (the overflow bucket) sorts last
+    return sorted(counts.items(), key=lambda bucket: (bucket[0] is None, bucket[0] or 0))
+
+
+def histogram_percentile(histogram, q):
+    """Upper edge of the bucket holding the nearest-rank `q`th percentile, or None if empty."""
+    total = sum(count for _, count in histogram)
+    if not total:
+        return None
+    rank = max(1, -(-total * q // 100))
+    for edge, count in histogram:
+        rank -= count
+        if rank <= 0:
+            return edge
+
+
+class InstrumentedAgent:
+    """Wraps an agent and records every decision it makes in `log`.
+
+    Any other attribute is read from and written to the wrapped agent, so
+    settings such as `time_budget` can still be changed through the wrapper.
+    """
+
+    def __init__(self, agent, log=None, allocations=0):
+        self.agent = agent
+        self.log = log if log is not None else DecisionLog()
+        self.allocations = allocations
+
+    OWN = ('agent', 'log', 'allocations')
+
+    def __getattr__(self, name):
+        if name in InstrumentedAgent.OWN:
+            raise AttributeError(name)
+        return getattr(self.agent, name)
+
+    def __setattr__(self, name, value):
+        if name in InstrumentedAgent.OWN:
+            object.__setattr__(self, name, value)
+        else:
+            setattr(self.agent, name, value)
+
+    def reset(self):
+        if hasattr(self.agent, 'reset'):
+            self.agent.reset()
+
+    def __call__(self, obs, index=0):
+        stats = getattr(self.agent, 'stats', None)
+        if stats is not None:
+            stats.clear()
+        traced = bool(self.allocations) and self.log.decisions % self.allocations == 0
+        if traced:
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+
+        start = time.perf_counter()
+        action = self.agent(obs, index)
+        elapsed = time.perf_counter() - start
+
+        allocated = -1
+        if traced:
+            allocated = tracemalloc.get_traced_memory()[1] - baseline
+            if started:
+                tracemalloc.stop()
+        self.log.record(elapsed, stats, allocated)
+        return action
@@ -0,0 +1,194 @@
+"""Local search policies used by the SnakeGameAILocalSearchMethods games.
+
+Source: Claude 3.5 Sonnet, https://claude.ai
+"""
+
+import math
+import random
+from functools import lru_cache
+
+GRID_WIDTH = 20
+GRID_HEIGHT = 20
+
+
+# Hill Climbing AI
+def hill_climbing(snake, food, width=GRID_WIDTH, height=GRID_HEIGHT, distances=None, stats=None):
+    # `distances` (a DistanceField array) replaces the straight-line distance with the path length;
+    # `stats` (a SearchStats) gets the moves scored
+    current_head = snake.head
+    best_direction = snake.direction
+    best_distance = math.inf
+    scored = 0
+
+    for dx, dy in [(0, -1), (0, 1), (-1, 0), (1, 0)]:
+        new_head = (current_head[0] + dx, current_head[1] + dy)
+
+        # Check if the new head is within bounds and not colliding with the snake's body
+        if (0 <= new_head[0] < width and 0 <= new_head[1] < height
+                and not snake.collides(new_head)):
+            if distances is None:
+                distance = math.sqrt((new_head[0] - food[0])**2 + (new_head[1] - food[1])**2)
+            else:
+                distance = distances[new_head[1] * width + new_head[0]]
+            scored += 1
+
+            if distance < best_distance:
+                best_distance = distance
+                best_direction = (dx, dy)
+
+    if stats is not None:
+        stats.add(scored, 0, 1)
+    return best_direction
+
+
+# Simulated Annealing AI
+def simulated_annealing(snake, food, temperature=10.0, cooling_rate=0.99, width=GRID_WIDTH, height=GRID_HEIGHT,
+                        distances=None, stats=None, rng=random):
+    # Draws from `rng`, the random module unless a game passes its own random.Random
+    current_head = snake.head
+    current_direction = snake.direction
+    if distances is None:
+        current_distance = math.sqrt((current_head[0] - food[0])**2 + (current_head[1] - food[1])**2)
+    else:
+        current_distance = distances[current_head[1] * width + current_head[0]]
+    proposals = 0
+
+    while temperature > 0.1:
+        proposals += 1
+        new_direction = rng.choice([(0, -1), (0, 1), (-1, 0), (1, 0)])
+        new_head = (current_head[0] + new_direction[0], current_head[1] + new_direction[1])
+
+        # Check if the new head is within bounds
+        if not (0 <= new_head[0] < width and 0 <= new_head[1] < height):
+            temperature *= cooling_rate
+            continue
+
+        if snake.collides(new_head):
+            temperature *= cooling_rate
+            continue
+
+        if distances is None:
+            new_distance = math.sqrt((new_head[0] - food[0])**2 + (new_head[1] - food[1])**2)
+        else:
+            new_distance = distances[new_head[1] * width + new_head[0]]
+
+        if new_distance < current_distance:
+            current_direction = new_direction
+            current_distance = new_distance
+        else:
+            probability = math.exp((current_distance - new_distance) / temperature)
+            if rng.random() < probability:
+                current_direction = new_direction
+                current_distance = new_distance
+
+        temperature *= cooling_rate
+
+    if stats is not None:
+        stats.add(proposals, 0, 1)
+    return current_direction
+
+
+MOVES = [(0, -1), (0, 1), (-1, 0), (1, 0)]
+
+
+@lru_cache(maxsize=None)
+def annealing_schedule(temperature=10.0, cooling_rate=0.99):
+    """(temperatures, stay_bound) for simulated_annealing's cooling loop.
+
+    stay_bound[i] bounds the chance that the search still holds its starting
+    direction after i steps. A neighbor of the head is never more than 1
+    farther from the food than the head is, so while any move is valid each
+    step leaves the start with probability at least exp(-1 / T) / 4.
+    """
+    temperatures = []
+    while temperature > 0.1:
+        temperatures.append(temperature)
+        temperature *= cooling_rate
+    stay_bound = [1.0]
+    for t in temperatures:
+        stay_bound.append(stay_bound[-1] * (1.0 - 0.25 * math.exp(-1.0 / t)))
+    return tuple(temperatures), tuple(stay_bound)
+
+
+# Simulated Annealing AI, sampled from the end of the schedule
+def fast_simulated_annealing(snake, food, temperature=10.0, cooling_rate=0.99, width=GRID_WIDTH, height=GRID_HEIGHT,
+                             distances=None, stats=None, rng=random):
+    """Draws from the same distribution of directions as simulated_annealing, in a few steps.
+
+    The search only ever holds the starting direction or one of the four
+    moves, and a move at the minimum distance is accepted from any other
+    move. So whatever happened earlier, the search sits on that move right
+    after the last step that proposed it. The last such step is found by
+    drawing the proposals backwards from the end of the schedule (four steps
+    on average), and only the steps after it are played out. The start
+    direction can only still be held at that point with a probability below
+    stay_bound, and is then checked exactly.
+
+    With `distances` the bound still holds: the head's path distance is one
+    more than that of its nearest free neighbor, or all of them are
+    unreachable together. `stats` gets the proposals drawn, and the draws
+    come from `rng` as in simulated_annealing.
+    """
+    current_head = snake.head
+    candidates = []
+    for dx, dy in MOVES:
+        new_head = (current_head[0] + dx, current_head[1] + dy)
+        if not (0 <= new_head[0] < width and 0 <= new_head[1] < height and not snake.collides(new_head)):
+            candidates.append(None)
+        elif distances is None:
+            candidates.append(math.sqrt((new_head[0] - food[0])**2 + (new_head[1] - food[1])**2))
+        else:
+            candidates.append(distances[new_head[1] * width + new_head[0]])
+    valid = [distance for distance in candidates if distance is not None]
+    if not valid:
+        return snake.direction
+    best = min(valid)
+
+    temperatures, stay_bound = annealing_schedule(temperature, cooling_rate)
+    if distances is None:
+        start_distance = math.sqrt((current_head[0] - food[0])**2 + (current_head[1] - food[1])**2)
+    else:
+        start_distance = distances[current_head[1] * width + current_head[0]]
+    later = []
+    step = len(temperatures) - 1
+    while step >= 0:
+        move = rng.randrange(4)
+        if candidates[move] == best:
+            break
+        later.append(move)
+        step -= 1
+    drawn = len(later) + (step >= 0)
+
+    current_direction, current_distance = snake.direction, start_distance
+    if step >= 0:
+        stay = rng.random()
+        if stay >= stay_bound[step] or stay >= _stay_probability(candidates, start_distance, temperatures[:step]):
+            current_direction, current_distance = MOVES[move], best
+        elif best < start_distance or rng.random() < math.exp((start_distance - best) / temperatures[step]):
+            current_direction, current_distance = MOVES[move], best
+        step += 1
+    else:
+        step = 0  # No step proposed the best move: play the whole schedule from the start
+
+    for move in reversed(later):
+        new_distance = candidates[move]
+        if new_distance is not None:
+            if new_distance < current_distance:
+                current_direction, current_distance = MOVES[move], new_distance
+            elif rng.random() < math.exp((current_distance - new_distance) / temperatures[step]):
+                current_direction, current_distance = MOVES[move], new_distance
+        step += 1
+
+    if stats is not None:
+        stats.add(drawn, 0, 1)
+    return current_direction
+
+
+def _stay_probability(candidates, start_distance, temperatures):
+    # Exact chance that simulated_annealing keeps its starting direction through `temperatures`
+    valid = [distance for distance in candidates if distance is not None]
+    stay = 1.0
+    for t in temperatures:
+        leave = sum(min(1.0, math.exp((start_distance - distance) / t)) for distance in valid)
+        stay *= 1.0 - leave / 4
+    return stay
@@ -0,0 +1,352 @@
+"""Monte Carlo Tree Search for the two-snake arena.
+
+Minimax at depth 2 looks one move ahead for each snake. MCTS instead grows a
+tree toward the lines that look best, so it keeps getting stronger the more
+playouts it is given. Both snakes move at once, so the tree is decoupled
+UCT: every node keeps separate visit and value counts for each snake's
+moves, each snake picks its own move by UCB, and the children are keyed by
+the joint move.
+
+A playout restores the root position (a few bytearray copies), walks the
+tree, then plays random safe moves (biased toward the food) for up to
+`horizon` ticks on the same Board and RingBody model the minimax search
+uses. The tree is kept from tick to tick and re-rooted at the child for the
+joint move that was actually played.
+
+Everything a playout finds is discounted by `discount` per tick from the
+root: food eaten now is worth more than food eaten later, and a death
+further off costs less than one right ahead. A playout that ends with both
+snakes alive also counts part of a meal for how near each is to the food,
+so food out of a rollout's reach still draws the snake toward it. The tree
+never tries a move into a wall or a body when there is another: those
+certain deaths, averaged in with everything else, made the cells next to a
+wall (where the food often is) look worse than they are.
+"""
+
+import itertools
+import math
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from .board import DIRECTIONS, OFF_GRID, Board, RingBody
+from .instrument import SearchStats
+
+# Values are snake 0's result: 1 it wins, 0 it loses, 0.5 for a draw
+WIN, LOSS, DRAW = 1.0, 0.0, 0.5
+
+
+class Position:
+    """Both snakes and the food on a Board, with save() and restore().
+
+    Side 0 is the snake searching; side 1 is the opponent, which may have no
+    body (a single-snake game), in which case it only ever passes.
+    """
+
+    def __init__(self, width, height, wrap, bodies, food, rng):
+        self.board = Board(width, height, wrap)
+        self.bodies = [RingBody(self.board, body) for body in bodies]
+        self.food = self.board.cell(*food) if food is not None else OFF_GRID
+        self.rng = rng
+
+    def save(self):
+        board = self.board
+        return (bytes(board.occupied), board.free, self.food,
+                [(body.buffer[:], bytes(body.cells), body.start, body.length) for body in self.bodies])
+
+    def restore(self, saved):
+        occupied, free, self.food, bodies = saved
+        self.board.occupied[:] = occupied
+        self.board.free = free
+        for body, (buffer, cells, start, length) in zip(self.bodies, bodies):
+            body.buffer[:] = buffer
+            body.cells[:] = cells
+            body.start = start
+            body.length = length
+
+    def moves(self, side):
+        """Direction indices for snake `side` that do not crash at once (all but the neck if every one does)."""
+        body = self.bodies[side]
+        if not body:
+            return [None]
+        board = self.board
+        occupied, steps = board.occupied, board.steps
+        head, neck = body.head, body.neck
+        tails = [other.tail for other in self.bodies if other]  # move away unless that snake eats
+        moves = [d for d in range(4) if steps[d][head] != neck]
+        safe = [d for d in moves
+                if steps[d][head] != OFF_GRID and (not occupied[steps[d][head]] or steps[d][head] in tails)]
+        return safe or moves
+
+    def step(self, moves):
+        """Moves both snakes at once by the engine's rules; returns which of them died."""
+        board = self.board
+        heads = []
+        eaten = False
+        for body, d in zip(self.bodies, moves):
+            if d is None:
+                heads.append(None)
+                continue
+            head = board.steps[d][body.head]
+            heads.append(head)
+            if head != OFF_GRID:
+                grow = head == self.food
+                eaten = eaten or grow
+                body.move(head, grow)
+        dead = [head is not None and (head == OFF_GRID or board.occupied[head] > 1) for head in heads]
+        if eaten and not any(dead):
+            self.food = self.spawn_food()
+        return dead
+
+    def distance(self, a, b):
+        """Manhattan distance between cells `a` and `b`, as a fraction of the board's width + height."""
+        width = self.board.width
+        return (abs(a % width - b % width) + abs(a // width - b // width)) / (width + self.board.height)
+
+    def spawn_food(self):
+        board = self.board
+        if not board.free:
+            return OFF_GRID
+        occupied, randrange, size = board.occupied, self.rng.randrange, board.size
+        while True:
+            cell = randrange(size)
+            if not occupied[cell]:
+                return cell
+
+    def rollout_move(self, side, greed):
+        """A random move that does not crash at once, toward the food with probability `greed`."""
+        body = self.bodies[side]
+        if not body:
+            return None
+        board = self.board
+        occupied = board.occupied
+        safe = [(d, cell) for d, cell in board.neighbors[body.head] if not occupied[cell]]
+        if not safe:
+            return 0
+        if self.food != OFF_GRID and self.rng.random() < greed:
+            width = board.width
+            food_x, food_y = self.food % width, self.food // width
+            return min(safe, key=lambda move: abs(move[1] % width - food_x) + abs(move[1] // width - food_y))[0]
+        return self.rng.choice(safe)[0]
+
+
+class Node:
+    """Per-snake move statistics for one position in the tree."""
+
+    __slots__ = ('moves', 'visits', 'counts', 'values', 'children')
+
+    def __init__(self, position):
+        self.moves = (position.moves(0), position.moves(1))
+        self.visits = 0
+        self.counts = ([0] * len(self.moves[0]), [0] * len(self.moves[1]))
+        self.values = ([0.0] * len(self.moves[0]), [0.0] * len(self.moves[1]))
+        self.children = {}
+
+    def select(self, side, exploration):
+        """Index of the move with the best UCB score for snake `side`; untried moves first."""
+        counts, values = self.counts[side], self.values[side]
+        log_visits = math.log(self.visits + 1)
+        best, best_score = 0, -math.inf
+        for i, count in enumerate(counts):
+            if not count:
+                return i
+            score = values[i] / count + exploration * math.sqrt(log_visits / count)
+            if score > best_score:
+                best, best_score = i, score
+        return best
+
+    def update(self, i, j, value):
+        self.visits += 1
+        self.counts[0][i] += 1
+        self.values[0][i] += value
+        self.counts[1][j] += 1
+        self.values[1][j] += 1.0 - value
+
+
+class MCTS:
+    """Decoupled UCT search over a Position."""
+
+    def __init__(self, position, root=None, exploration=1.4, horizon=20, greed=0.5, discount=0.9):
+        self.position = position
+        self.saved = position.save()
+        self.root = root if root is not None else Node(position)
+        self.exploration = exploration
+        self.horizon = horizon
+        self.greed = greed
+        self.discount = discount
+        self.playouts = 0
+
+    def search(self, playouts, deadline=None):
+        """Runs `playouts` more playouts (None: no limit), or fewer if `deadline` (perf_counter) passes first."""
+        for n in (itertools.count() if playouts is None else range(playouts)):
+            if deadline is not None and n & 7 == 0 and time.perf_counter() > deadline:
+                break
+            self.playout()
+        return self.root
+
+    def step(self, moves):
+        """Plays one tick of the playout; returns which snakes died, like Position.step.
+
+        Adds the tick's weight to `growth` for every snake that ate.
+        """
+        bodies = self.position.bodies
+        lengths = [len(body) for body in bodies]
+        dead = self.position.step(moves)
+        for side, body in enumerate(bodies):
+            if len(body) > lengths[side]:
+                self.growth[side] += self.weight
+        self.weight *= self.discount
+        return dead
+
+    def playout(self):
+        position = self.position
+        position.restore(self.saved)
+        self.weight = 1.0  # of the tick about to be played
+        self.growth = [0.0, 0.0]
+        node = self.root
+        path = []
+        while True:
+            i = node.select(0, self.exploration)
+            j = node.select(1, self.exploration)
+            path.append((node, i, j))
+            dead = self.step((node.moves[0][i], node.moves[1][j]))
+            if any(dead):
+                value = self.result(dead)
+                break
+            child = node.children.get((i, j))
+            if child is None:
+                node.children[(i, j)] = Node(position)
+                value = self.rollout()
+                break
+            node = child
+        for node, i, j in path:
+            node.update(i, j, value)
+        self.playouts += 1
+
+    def rollout(self):
+        position = self.position
+        for _ in range(self.horizon):
+            dead = self.step((position.rollout_move(0, self.greed), position.rollout_move(1, self.greed)))
+            if any(dead):
+                return self.result(dead)
+        # Nobody died: part of a meal for being near the food, so a far-off food still draws the snake in
+        for side, body in enumerate(position.bodies):
+            if body and position.food != OFF_GRID:
+                self.growth[side] += self.weight * (1.0 - position.distance(body.head, position.food))
+        return self.growth_value()
+
+    def growth_value(self):
+        # Whoever grew more since the root, and sooner, is ahead
+        return 0.5 + 0.5 * math.tanh((self.growth[0] - self.growth[1]) / 2.0)
+
+    def result(self, dead):
+        """Value of the tick that just killed a snake, discounted toward the food eaten so far."""
+        if dead[0]:
+            value = DRAW if dead[1] else LOSS
+        else:
+            value = WIN
+        # The weight has already moved past the tick that was played
+        weight = self.weight / self.discount
+        return weight * value + (1.0 - weight) * self.growth_value()
+
+
+def best_move(root):
+    """Snake 0's most visited move at `root`, as a direction index; ties go to the better mean value."""
+    counts, values = root.counts[0], root.values[0]
+    return root.moves[0][max(range(len(counts)), key=lambda i: (counts[i], values[i]))]
+
+
+def _search_worker(args):
+    # One root-parallel search in a worker process; returns visits per move
+    width, height, wrap, bodies, food, seed, playouts, deadline, options = args
+    position = Position(width, height, wrap, bodies, food, random.Random(seed))
+    root = MCTS(position, **options).search(playouts, deadline)
+    return dict(zip(root.moves[0], root.counts[0]))
+
+
+class MCTSAgent:
+    """UCT agent for the two-snake arena (and single-snake games).
+
+    `playouts` is the budget per move; with a `time_budget` in milliseconds
+    the search stops at whichever runs out first (set `playouts` to None to
+    search for the whole time budget). The tree is reused from
+    one tick to the next. With `workers` > 1 the playouts are split across
+    a process pool, each worker growing its own tree from the same root and
+    the root visit counts summed (no tree reuse in that mode).
+    """
+
+    def __init__(self, playouts=500, time_budget=None, workers=1, seed=None, exploration=1.4, horizon=20,
+                 greed=0.5, discount=0.9):
+        self.playouts = playouts
+        self.time_budget = time_budget
+        self.workers = workers
+        self.rng = random.Random(seed)
+        self.options = {'exploration': exploration, 'horizon': horizon, 'greed': greed, 'discount': discount}
+        self.pool = None
+        self.tree = None  # (root, steps, food, heads, our move index) from the last move
+        self.reused = 0
+        self.stats = SearchStats()  # nodes are playouts
+
+    def reset(self):
+        self.tree = None
+
+    def __call__(self, obs, index=0):
+        snake = obs.snakes[index]
+        opponents = [other for other in obs.snakes if other is not snake]
+        bodies = [snake.body, opponents[0].body if opponents else []]
+        deadline = None
+        if self.time_budget is not None:
+            deadline = time.perf_counter() + self.time_budget / 1000.0
+
+        if self.workers > 1:
+            return DIRECTIONS[self.parallel_search(obs, bodies, deadline)]
+
+        position = Position(obs.width, obs.height, obs.wrap, bodies, obs.food, self.rng)
+        heads = tuple(body.head for body in position.bodies if body)
+        root = self.reuse(obs, position)
+        search = MCTS(position, root, **self.options)
+        self.reused += search.root.visits
+        root = search.search(self.playouts, deadline)
+        self.stats.add(search.playouts)
+        move = best_move(root)
+        self.tree = (root, obs.steps, obs.food, heads, root.moves[0].index(move))
+        return DIRECTIONS[move]
+
+    def reuse(self, obs, position):
+        """The child of the last root for the joint move just played, if the game went as expected."""
+        if self.tree is None:
+            return None
+        root, steps, food, heads, i = self.tree
+        self.tree = None
+        # Food that moved means one of us ate, and the tree guessed the new food at random
+        if obs.steps != steps + 1 or obs.food != food or len(heads) != sum(1 for body in position.bodies if body):
+            return None
+        board = position.board
+        new_heads = [body.head for body in position.bodies if body]
+        for (child_i, j), child in root.children.items():
+            if child_i != i:
+                continue
+            expected = [board.steps[root.moves[0][i]][heads[0]]]
+            if len(heads) > 1:
+                expected.append(board.steps[root.moves[1][j]][heads[1]])
+            if expected == new_heads:
+                return child
+        return None
+
+    def parallel_search(self, obs, bodies, deadline):
+        if self.pool is None:
+            self.pool = ProcessPoolExecutor(self.workers)
+        share = None if self.playouts is None else -(-self.playouts // self.workers)
+        jobs = [(obs.width, obs.height, obs.wrap, bodies, obs.food, self.rng.getrandbits(32), share, deadline,
+                 self.options) for _ in range(self.workers)]
+        visits = {}
+        for counts in self.pool.map(_search_worker, jobs):
+            for move, count in counts.items():
+                visits[move] = visits.get(move, 0) + count
+        self.stats.add(sum(visits.values()))
+        return max(visits, key=visits.get)
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
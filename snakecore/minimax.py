@@ -0,0 +1,447 @@
+"""Minimax snake AI with alpha-beta pruning used by the SnakeAIMinimax games.
+
+Source: Claude 3.5 Sonnet, https://claude.ai
+"""
+
+import math
+import random
+import time
+from enum import Enum
+
+from .board import OFF_GRID, Board, RingBody
+from .engine import DOWN, LEFT, RIGHT, UP
+from .territory import RegionCache
+from .transposition import EXACT, LOWER, UPPER, TranspositionTable, zobrist_keys
+
+GRID_WIDTH = 32
+GRID_HEIGHT = 24
+
+
+# Directions
+class Direction(Enum):
+    UP = 1
+    DOWN = 2
+    LEFT = 3
+    RIGHT = 4
+
+
+# Grid steps for each Direction, matching the engine's (dx, dy) tuples
+VECTORS = {Direction.UP: UP, Direction.DOWN: DOWN, Direction.LEFT: LEFT, Direction.RIGHT: RIGHT}
+DIRECTION_OF = {vector: direction for direction, vector in VECTORS.items()}
+
+
+# Ordering bonus for a killer move; history scores stay far below it
+KILLER_BONUS = 1 << 20
+
+
+class SearchTimeout(Exception):
+    """Raised inside the search when an iterative-deepening time budget runs out."""
+
+
+class Workspace:
+    """The board, the two bodies and the history tables a search plays on.
+
+    Building them costs more than a shallow search on a large board, so the
+    agents keep one Workspace and hand it to every search, which reloads it
+    with the current position. Only one search may use it at a time.
+    """
+
+    def __init__(self, width, height, wrap=False):
+        self.board = Board(width, height, wrap)
+        self.bodies = (RingBody(self.board, []), RingBody(self.board, []))
+        self.history = ([0] * (self.board.size * 4), [0] * (self.board.size * 4))
+        self.clear_history = [0] * (self.board.size * 4)
+        self.clear_board = bytes(self.board.size)
+
+    def fits(self, width, height, wrap):
+        board = self.board
+        return (board.width, board.height, board.wrap) == (width, height, wrap)
+
+    def load(self, bodies):
+        """Puts the bodies (lists of cells, head first) on the cleared board and clears the history."""
+        board = self.board
+        board.occupied[:] = self.clear_board
+        for ring, cells in zip(self.bodies, bodies):
+            ring.load(cells)
+        board.free = board.occupied.count(0)
+        board.version += 1
+        board.distance_field = None
+        for history in self.history:
+            history[:] = self.clear_history
+
+
+class AISnake:
+    """Minimax player for `snake` against `opponent`.
+
+    The search plays moves in place on a Board with RingBody snakes and undoes
+    them on the way back up, so validity and collision tests are O(1). The
+    position is Zobrist-hashed as it goes, and results are kept in a
+    TranspositionTable (pass one in to keep it across moves), so a position
+    reached again through a different move order is not searched twice.
+    Pass a Workspace to reuse its board and tables instead of building new
+    ones.
+    """
+
+    def __init__(self, snake, opponent, food, width=GRID_WIDTH, height=GRID_HEIGHT, wrap=False, table=None,
+                 territory=False, regions=None, move_ordering=True, distances=None, rng=None, workspace=None):
+        self.snake = snake
+        self.opponent = opponent
+        self.food = food
+        self.width = width
+        self.height = height
+        # The two-player game wraps around the edges instead of having walls
+        self.wrap = wrap
+        # Made on first use: JointSearch never needs one
+        self.table = table
+        # Score the space each head can actually reach instead of all empty cells
+        self.territory = territory
+        self.region_cache = regions if regions is not None else RegionCache()
+        self.regions = None
+        # Killer moves and the history table, on top of trying the TT move first
+        self.move_ordering = move_ordering
+        # Path distances to the food (a DistanceField array for the root position) instead of Manhattan
+        self.distances = distances
+        # Tie-breaking draws: the game's own random.Random, or the random module
+        self.rng = rng if rng is not None else random
+        self.workspace = workspace
+
+    def setup_board(self):
+        width, height = self.width, self.height
+        workspace = self.workspace
+        if workspace is None or not workspace.fits(width, height, self.wrap):
+            workspace = self.workspace = Workspace(width, height, self.wrap)
+        bodies = [[y * width + x for x, y in snake.body if 0 <= x < width and 0 <= y < height]
+                  for snake in (self.snake, self.opponent)]
+        workspace.load(bodies)
+        self.board = workspace.board
+        self.snake_body, self.opponent_body = self.bodies = workspace.bodies
+        self.history = workspace.history
+        self.food_cell = self.board.cell(*self.food)
+
+        self.keys = zobrist_keys(self.board.size)
+        self.hash = self.keys.food[self.food_cell]
+        for side, cells in enumerate(bodies):
+            body_keys = self.keys.body[side]
+            for cell in cells:
+                self.hash ^= body_keys[cell]
+            if cells:
+                self.hash ^= self.keys.head[side][cells[0]]
+
+    def play(self, side, new_head, grow=False):
+        """Moves snake `side` (0 is us) to `new_head`; returns what undo() needs."""
+        body = self.bodies[side]
+        old_head = body.head
+        tail = body.move(new_head, grow)
+        body_keys, head_keys = self.keys.body[side], self.keys.head[side]
+        self.hash ^= body_keys[new_head] ^ head_keys[old_head] ^ head_keys[new_head]
+        if tail != OFF_GRID:
+            self.hash ^= body_keys[tail]
+        return tail
+
+    def undo(self, side, tail):
+        body = self.bodies[side]
+        new_head = body.head
+        body.undo_move(tail)
+        body_keys, head_keys = self.keys.body[side], self.keys.head[side]
+        self.hash ^= body_keys[new_head] ^ head_keys[body.head] ^ head_keys[new_head]
+        if tail != OFF_GRID:
+            self.hash ^= body_keys[tail]
+
+    def ordered_moves(self, side, body, hash_move, ply):
+        """Moves for `body` in the order to search them.
+
+        The transposition-table move goes first. With move ordering on, the
+        killer moves for this ply come next, then the rest by history score
+        and finally by distance to the food.
+        """
+        moves = self.get_possible_moves(body)
+        if not self.move_ordering:
+            if hash_move in moves:
+                moves.remove(hash_move)
+                moves.insert(0, hash_move)
+            return moves
+
+        killers = self.killers[ply]
+        history = self.history[side]
+        steps = self.board.steps
+        head = body.head
+        food_x, food_y = self.food
+        width = self.width
+
+        def priority(move):
+            if move == hash_move:
+                return math.inf
+            d = move.value - 1
+            score = history[head * 4 + d]
+            if move in killers:
+                score += KILLER_BONUS
+            new_head = steps[d][head]
+            if new_head != OFF_GRID:
+                score -= abs(new_head % width - food_x) + abs(new_head // width - food_y)
+            return score
+
+        moves.sort(key=priority, reverse=True)
+        return moves
+
+    def record_cutoff(self, side, body, move, depth, ply, first):
+        """Remembers `move` as having refuted the position at `ply`."""
+        self.cutoffs += 1
+        if first:
+            self.first_move_cutoffs += 1
+        if not self.move_ordering:
+            return
+        killers = self.killers[ply]
+        if move not in killers:
+            killers.insert(0, move)
+            del killers[2:]
+        self.history[side][body.head * 4 + move.value - 1] += depth * depth
+
+    def get_best_move(self, depth, time_budget=None, started=None):
+        """Best Direction from a `depth`-ply search.
+
+        With a `time_budget` in milliseconds the search deepens one ply at a
+        time up to `depth` instead, trying the previous iteration's best moves
+        first, and returns the result of the deepest iteration that finished
+        within the budget. The first ply is always completed. The budget runs
+        from `started` (a time.perf_counter() reading, by default the call),
+        so it covers setting up the search too.
+        """
+        if started is None:
+            started = time.perf_counter()
+        self.setup_board()
+        if self.table is None:
+            self.table = TranspositionTable()
+        self.table.new_search()
+        self.nodes = 0
+        self.cutoffs = 0
+        self.first_move_cutoffs = 0
+        self.killers = [[] for _ in range(depth + 1)]
+        self.deadline = None
+        self.completed_depth = 0
+
+        root_moves = self.get_possible_moves(self.snake_body)
+        if time_budget is None:
+            best_moves, _ = self.search_root(depth, root_moves)
+            self.completed_depth = depth
+        else:
+            deadline = started + time_budget / 1000.0
+            best_moves, scores = self.search_root(1, root_moves)
+            self.completed_depth = 1
+            self.deadline = deadline
+            for iteration_depth in range(2, depth + 1):
+                # Best moves of the last iteration first, for earlier cutoffs
+                order = sorted(scores, key=scores.get, reverse=True)
+                try:
+                    best_moves, scores = self.search_root(iteration_depth, order)
+                except SearchTimeout:
+                    break
+                self.completed_depth = iteration_depth
+                if time.perf_counter() >= deadline:
+                    break
+
+        if not best_moves:
+            return self.rng.choice(list(Direction))
+        return self.rng.choice(best_moves)
+
+    def search_root(self, depth, moves):
+        """Scores every valid move in `moves`; returns (tied best moves, {move: score})."""
+        best_score = -math.inf
+        best_moves = []
+        scores = {}
+        alpha = -math.inf
+        beta = math.inf
+
+        self.root_depth = depth
+        if self.territory:
+            self.regions = self.region_cache.get(self.hash, self.board)
+        entry = self.table.probe(self.hash)
+        if entry is not None and entry.move in moves:
+            moves = [entry.move] + [move for move in moves if move != entry.move]
+        for move in moves:
+            new_head = self.get_new_head(self.snake_body, move)
+            if self.is_valid_move(new_head):
+                tail = self.play(0, new_head)
+                score = self.minimax(depth - 1, False, alpha, beta)
+                self.undo(0, tail)
+                scores[move] = score
+                if score > best_score:
+                    best_score = score
+                    best_moves = [move]
+                elif score == best_score:
+                    best_moves.append(move)
+                alpha = max(alpha, best_score)
+                if beta <= alpha:
+                    break
+
+        if best_moves:
+            self.table.store(self.hash, depth, best_score, EXACT, best_moves[0])
+        return best_moves, scores
+
+    def minimax(self, depth, is_maximizing, alpha, beta):
+        self.nodes += 1
+        if self.deadline is not None and not self.nodes & 31 and time.perf_counter() > self.deadline:
+            # Abandons the iteration; the board is rebuilt by the next get_best_move
+            raise SearchTimeout
+        if depth == 0 or self.is_game_over(self.snake_body.head):
+            return self.evaluate()
+
+        key = self.hash if is_maximizing else self.hash ^ self.keys.side
+        if depth == 1 and self.territory:
+            # Shared by all the leaves below this node. Labelling is slow next to
+            # the other node work, so the clock is checked after every one
+            self.regions = self.region_cache.get(key, self.board)
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise SearchTimeout
+
+        if not is_maximizing and not self.opponent_body:
+            # Single-snake game: the opponent's turn is a pass
+            return self.minimax(depth - 1, True, alpha, beta)
+
+        entry = self.table.probe(key)
+        hash_move = None
+        if entry is not None:
+            hash_move = entry.move
+            if entry.depth >= depth:
+                if entry.flag == EXACT:
+                    return entry.value
+                if entry.flag == LOWER:
+                    alpha = max(alpha, entry.value)
+                else:
+                    beta = min(beta, entry.value)
+                if beta <= alpha:
+                    return entry.value
+        window_alpha, window_beta = alpha, beta
+        best_move = None
+        ply = self.root_depth - depth
+        searched = 0
+
+        if is_maximizing:
+            body = self.snake_body
+            max_eval = -math.inf
+            for move in self.ordered_moves(0, body, hash_move, ply):
+                new_head = self.get_new_head(body, move)
+                if self.is_valid_move(new_head):
+                    tail = self.play(0, new_head)
+                    eval = self.minimax(depth - 1, False, alpha, beta)
+                    self.undo(0, tail)
+                    searched += 1
+                    if eval > max_eval:
+                        max_eval = eval
+                        best_move = move
+                    alpha = max(alpha, eval)
+                    if beta <= alpha:
+                        self.record_cutoff(0, body, move, depth, ply, searched == 1)
+                        break
+            value = max_eval
+        else:
+            body = self.opponent_body
+            min_eval = math.inf
+            for move in self.ordered_moves(1, body, hash_move, ply):
+                new_head = self.get_new_head(body, move)
+                if self.is_valid_move(new_head):
+                    tail = self.play(1, new_head)
+                    eval = self.minimax(depth - 1, True, alpha, beta)
+                    self.undo(1, tail)
+                    searched += 1
+                    if eval < min_eval:
+                        min_eval = eval
+                        best_move = move
+                    beta = min(beta, eval)
+                    if beta <= alpha:
+                        self.record_cutoff(1, body, move, depth, ply, searched == 1)
+                        break
+            value = min_eval
+
+        if value <= window_alpha:
+            flag = UPPER
+        elif value >= window_beta:
+            flag = LOWER
+        else:
+            flag = EXACT
+        self.table.store(key, depth, value, flag, best_move)
+        return value
+
+    def get_possible_moves(self, body=None):
+        moves = [Direction.UP, Direction.DOWN, Direction.LEFT, Direction.RIGHT]
+        if body is not None and len(body) > 1:
+            # Turning back into the neck is always a crash
+            neck = body.neck
+            moves = [move for move in moves if self.get_new_head(body, move) != neck]
+        return moves
+
+    def effective_branching_factor(self):
+        """nodes ** (1 / depth) for the last search: how many children a node really cost."""
+        if not self.completed_depth:
+            return 0.0
+        return self.nodes ** (1.0 / self.completed_depth)
+
+    def get_new_head(self, body, direction):
+        # Direction values follow the order of the board's step tables
+        return self.board.steps[direction.value - 1][body.head]
+
+    def is_valid_move(self, new_head):
+        # Off the grid, or any snake cell, including both tails which have not moved yet
+        return new_head != OFF_GRID and not self.board.occupied[new_head]
+
+    def is_game_over(self, head):
+        return head == OFF_GRID or self.board.occupied[head] > 1
+
+    def evaluate(self):
+        # Constant time: everything comes from the head's cell, its neighbors and
+        # counters the board and bodies keep up to date as moves are played
+        board = self.board
+        head = self.snake_body.head
+
+        if head == OFF_GRID:
+            return -10000  # Heavily penalize moves that go out of bounds
+
+        head_xy = board.xy(head)
+        if self.distances is None:
+            distance_to_food = self.manhattan_distance(head_xy, self.food)
+        else:
+            distance_to_food = self.distances[head]
+
+        if head == self.food_cell:
+            return 10000
+
+        # Manhattan distance to the opponent below 2: on or right next to one of its cells
+        opponent_cells = self.opponent_body.cells
+        near_opponent = opponent_cells[head] or any(opponent_cells[cell] for _, cell in board.neighbors[head])
+        opponent_penalty = 50 if near_opponent else 0
+
+        # The head shares its cell with another of our own segments
+        self_penalty = 100 if self.snake_body.cells[head] > 1 else 0
+
+        # Penalize being close to the boundaries (there are none when wrapping)
+        boundary_penalty = 0
+        if not self.wrap:
+            if head_xy[0] == 0 or head_xy[0] == self.width - 1:
+                boundary_penalty += 50
+            if head_xy[1] == 0 or head_xy[1] == self.height - 1:
+                boundary_penalty += 50
+
+        if self.territory:
+            empty_space_score, trap_penalty = self.territory_score(head)
+        else:
+            empty_space_score, trap_penalty = board.free, 0
+
+        # Add a small random factor to break ties and prevent freezing
+        random_factor = self.rng.uniform(0, 1)
+
+        return (1000 - distance_to_food + empty_space_score - opponent_penalty - self_penalty - boundary_penalty
+                - trap_penalty + random_factor)
+
+    def territory_score(self, head):
+        """(space reachable from our head, penalty for being shut in a pocket shorter than our body)."""
+        space = self.regions.reachable(self.board, head)
+        trap_penalty = 0
+        if space < len(self.snake_body):
+            trap_penalty += 500
+        if self.opponent_body:
+            opponent_space = self.regions.reachable(self.board, self.opponent_body.head)
+            if opponent_space < len(self.opponent_body):
+                trap_penalty -= 500
+        return space, trap_penalty
+
+    def manhattan_distance(self, pos1, pos2):
+        return abs(pos1[0] - pos2[0]) + abs(pos1[1] - pos2[1])
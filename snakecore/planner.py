@@ -0,0 +1,116 @@
+"""Path reuse for the search agents.
+
+Searching from the head to the food on every frame throws away a path that
+is almost always still good. A snake that follows its own path only ever
+occupies cells it has already walked over and frees cells at its tail, so
+the rest of the path stays clear. The planner keeps that path and only runs
+the search again when the food moves, the snake is not where the path
+expected it to be, or the next cell has been taken (by another snake).
+
+In safe mode a new path is only taken if, once the snake has followed it and
+eaten, its head can still reach its tail: a snake that can follow its tail
+is never trapped. The check moves a RingBody along the path on a scratch copy
+of the board, so each step is O(1) and no body list is copied. If the path
+fails the check, or there is no path at all, the snake chases its tail
+instead and searches again next move.
+"""
+
+from .board import DIRECTION_INDEX, Board, RingBody
+from .instrument import SearchStats
+from .search import tail_path
+
+
+class PathPlanner:
+    """Caches the path from `search_function`.
+
+    With `trace=True` every search marks the cells it explored in `trace`, a
+    bytearray bitmap of the board that is allocated once and cleared before
+    each search. Otherwise `trace` stays None and the searches record nothing.
+
+    With `safe=True` new paths are checked as described above; next_move
+    then needs the snake's body. `tail_chases` counts the moves that went
+    toward the tail instead of the food.
+
+    Every search adds its work to `stats`, which the caller clears.
+    """
+
+    def __init__(self, search_function, trace=False, safe=False):
+        self.search_function = search_function
+        self.tracing = trace
+        self.trace = None
+        self.safe = safe
+        self.scratch = None
+        self.stats = SearchStats()
+        self.reset()
+
+    def reset(self):
+        # Remaining path, next step last so that taking it is a pop()
+        self.cells = []
+        self.moves = []
+        self.target = None
+        self.expected = None
+        if self.trace is not None:
+            self.trace[:] = bytes(len(self.trace))
+        self.searches = 0
+        self.reused = 0
+        self.tail_chases = 0
+
+    def is_valid(self, board, head, food):
+        return (bool(self.cells) and food == self.target and head == self.expected
+                and not board.occupied[self.cells[-1]])
+
+    def plan(self, board, head, food):
+        if self.tracing:
+            if self.trace is None or len(self.trace) != board.size:
+                self.trace = bytearray(board.size)
+            else:
+                self.trace[:] = bytes(board.size)
+        path = self.search_function(board, head, food, self.trace, stats=self.stats)
+        self.searches += 1
+        self.cells = []
+        self.moves = []
+        cell = head
+        for direction in path:
+            cell = board.steps[DIRECTION_INDEX[direction]][cell]
+            self.cells.append(cell)
+            self.moves.append(direction)
+        self.cells.reverse()
+        self.moves.reverse()
+        self.target = food
+
+    def leaves_way_out(self, board, body, food):
+        """Whether the head can reach the tail after `body` ((x, y) list, head first) follows the path."""
+        scratch = self.scratch
+        shape = (board.width, board.height, board.wrap)
+        if scratch is None or (scratch.width, scratch.height, scratch.wrap) != shape:
+            scratch = self.scratch = Board(*shape)
+        scratch.occupied[:] = board.occupied
+        scratch.free = board.free
+        snake = RingBody(scratch, body, placed=True)
+        for cell in reversed(self.cells):
+            snake.move(cell, cell == food)
+        return bool(tail_path(scratch, snake.head, snake.tail, stats=self.stats))
+
+    def next_move(self, board, head, food, body=None):
+        """The next (dx, dy) step towards `food`, or None when there is no path.
+
+        In safe mode, with `body`, this is a step toward the tail instead when
+        there is no path to the food or it would leave no way out.
+        """
+        if self.is_valid(board, head, food):
+            self.reused += 1
+        else:
+            self.plan(board, head, food)
+            if self.safe and body is not None and not (self.cells and self.leaves_way_out(board, body, food)):
+                path = tail_path(board, head, board.cell(*body[-1]), stats=self.stats)
+                if path:
+                    self.tail_chases += 1
+                    self.cells = []
+                    self.moves = []
+                    self.expected = None
+                    return path[0]
+        if not self.cells:
+            self.expected = None
+            return None
+        self.expected = self.cells.pop()
+        return self.moves.pop()
@@ -0,0 +1,113 @@
+"""Pygame window for a SnakeEngine.
+
+This is the only module that needs pygame. The renderer is an ordinary engine
+observer, so headless runs simply never create one.
+"""
+
+import pygame
+
+from .engine import Observer
+
+BLACK = (0, 0, 0)
+WHITE = (255, 255, 255)
+RED = (255, 0, 0)
+GREEN = (0, 255, 0)
+
+
+class PygameRenderer(Observer):
+    """Draws the board after every step and paces the game at `fps`.
+
+    `overlays` is a list of (color, cells) pairs where `cells` is a callable
+    returning grid cells to highlight, e.g. an agent's path. `bitmaps` is the
+    same for large highlights such as a search trace: the callable returns a
+    bytearray with one byte per cell (non-zero is highlighted, None to skip),
+    which is drawn as a single scaled blit.
+    `key_handlers` are called with every pygame KEYDOWN event.
+    """
+
+    def __init__(self, caption, width, height, cell_size, fps=10, background=BLACK, food_color=RED,
+                 snake_colors=(GREEN,), score_size=None, score_color=WHITE):
+        pygame.init()
+        self.cell_size = cell_size
+        self.screen = pygame.display.set_mode((width * cell_size, height * cell_size))
+        pygame.display.set_caption(caption)
+        self.clock = pygame.time.Clock()
+        self.fps = fps
+        self.background = background
+        self.food_color = food_color
+        self.snake_colors = snake_colors
+        # Score and length are written in the top-left corner when a font size is given
+        self.score_font = pygame.font.Font(None, score_size) if score_size else None
+        self.score_color = score_color
+        self.grid_size = (width, height)
+        self.overlays = []
+        self.bitmaps = []
+        self.key_handlers = []
+        self.closed = False
+
+    def on_reset(self, engine):
+        self.draw(engine)
+
+    def on_step(self, engine):
+        self.handle_events()
+        self.draw(engine)
+        self.clock.tick(self.fps)
+
+    def handle_events(self):
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.closed = True
+            elif event.type == pygame.KEYDOWN:
+                for handler in self.key_handlers:
+                    handler(event)
+
+    def draw_cell(self, color, cell):
+        size = self.cell_size
+        pygame.draw.rect(self.screen, color, (cell[0] * size, cell[1] * size, size, size))
+
+    def draw_bitmap(self, color, bitmap):
+        # One byte per cell as an 8-bit palette image: 0 is transparent, anything else `color`
+        surface = pygame.image.frombuffer(bitmap, self.grid_size, 'P')
+        surface.set_palette([(0, 0, 0)] + [color] * 255)
+        surface.set_colorkey(0)
+        self.screen.blit(pygame.transform.scale(surface, self.screen.get_size()), (0, 0))
+
+    def draw(self, engine):
+        self.screen.fill(self.background)
+        for color, bitmap in self.bitmaps:
+            bitmap = bitmap()
+            if bitmap is not None:
+                self.draw_bitmap(color, bitmap)
+        for color, cells in self.overlays:
+            for cell in cells():
+                self.draw_cell(color, cell)
+        self.draw_cell(self.food_color, engine.food)
+        for snake, color in zip(engine.snakes, self.snake_colors):
+            for cell in snake.body:
+                self.draw_cell(color, cell)
+        if self.score_font is not None:
+            snake = engine.snakes[0]
+            score_text = self.score_font.render(f"Score: {snake.score} Length: {snake.length}", True, self.score_color)
+            self.screen.blit(score_text, (10, 10))
+        pygame.display.flip()
+
+    def wait_for_restart(self, msg, color, font, background):
+        """Shows `msg` until the player presses C (returns True) or Q (returns False)."""
+        width, height = self.screen.get_size()
+        while True:
+            self.screen.fill(background)
+            self.screen.blit(font.render(msg, True, color), [width / 6, height / 3])
+            pygame.display.update()
+
+            for event in pygame.event.get():
+                if event.type == pygame.QUIT:
+                    return False
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_q:
+                        return False
+                    if event.key == pygame.K_c:
+                        return True
+            self.clock.tick(self.fps)
+
+    def close(self):
+        pygame.quit()
@@ -0,0 +1,269 @@
+"""Path searches used by the SnakeGamewAISearchMethods games.
+
+Source: ChatGPT https://chatgpt.com/
+
+Every search runs on a `Board`: positions are integer cells and a cell is
+blocked when `board.occupied[cell]` is non-zero, so testing a neighbor costs
+the same however long the snake is. Paths come back as (dx, dy) steps.
+
+The searches only record a parent per cell while they run and rebuild the
+path once the food is found, instead of carrying a copy of the path on every
+frontier entry. The parent array (two bytes a cell on boards of up to 32767
+cells) and the incoming-move bytearray are allocated once per board and
+reused by every search on it, so a search allocates little beyond its
+frontier. A search must therefore not start another on the same board
+before it returns.
+
+Pass a bytearray of `board.size` as `trace` to have a search mark every cell
+it explores (for the Highlight games); without one nothing is recorded. Pass
+a SearchStats as `stats` to have it add the nodes expanded, the frontier's
+peak size and the depth of the last node expanded.
+"""
+
+import heapq
+import math
+from array import array
+from collections import deque
+
+from .board import DIRECTIONS
+from .distance import distance_field
+
+NO_PARENT = -1
+
+
+def search_buffers(board):
+    """(parents, moves) for a new search on `board`: all parents NO_PARENT, moves uninitialized.
+
+    parents[cell] is the cell `cell` was reached from and moves[cell] the
+    direction index of that step. Both belong to the board and are handed
+    out again, cleared, to the next search.
+    """
+    buffers = board.search_buffers
+    if buffers is None:
+        cleared = array('h' if board.size <= 0x7fff else 'i', [NO_PARENT]) * board.size
+        buffers = board.search_buffers = (array(cleared.typecode, cleared), bytearray(board.size), cleared)
+    else:
+        buffers[0][:] = buffers[2]
+    return buffers[0], buffers[1]
+
+
+def reconstruct_path(parents, moves, start, goal):
+    """Walks the parent pointers back from `goal` and returns the (dx, dy) steps from `start`."""
+    path = []
+    cell = goal
+    while cell != start:
+        path.append(DIRECTIONS[moves[cell]])
+        cell = parents[cell]
+    path.reverse()
+    return path
+
+
+def report(stats, expanded, frontier_peak, parents, start, last):
+    # Adds a finished search to `stats`; the depth is counted back along the parents
+    if stats is None:
+        return
+    depth = 0
+    while last != start:
+        last = parents[last]
+        depth += 1
+    stats.add(expanded, frontier_peak, depth)
+
+
+def bfs(board, snake_head, food, trace=None, stats=None):
+    queue = deque([snake_head])
+    occupied = board.occupied
+    neighbors = board.neighbors
+    parents, moves = search_buffers(board)
+    parents[snake_head] = snake_head
+    expanded = frontier_peak = 0
+
+    while queue:
+        if len(queue) > frontier_peak:
+            frontier_peak = len(queue)
+        current_pos = queue.popleft()
+        expanded += 1
+        if trace is not None:
+            trace[current_pos] = 1
+
+        if current_pos == food:
+            report(stats, expanded, frontier_peak, parents, snake_head, current_pos)
+            return reconstruct_path(parents, moves, snake_head, food)
+
+        for d, next_pos in neighbors[current_pos]:
+            if parents[next_pos] == NO_PARENT and not occupied[next_pos]:
+                parents[next_pos] = current_pos
+                moves[next_pos] = d
+                queue.append(next_pos)
+    report(stats, expanded, frontier_peak, parents, snake_head, current_pos)
+    return []
+
+
+def tail_path(board, snake_head, tail, trace=None, stats=None):
+    """bfs to the snake's own tail, which is occupied but moves out of the way."""
+    queue = deque([snake_head])
+    occupied = board.occupied
+    neighbors = board.neighbors
+    parents, moves = search_buffers(board)
+    parents[snake_head] = snake_head
+    expanded = frontier_peak = 0
+
+    while queue:
+        if len(queue) > frontier_peak:
+            frontier_peak = len(queue)
+        current_pos = queue.popleft()
+        expanded += 1
+        if trace is not None:
+            trace[current_pos] = 1
+
+        for d, next_pos in neighbors[current_pos]:
+            if parents[next_pos] == NO_PARENT and (not occupied[next_pos] or next_pos == tail):
+                parents[next_pos] = current_pos
+                moves[next_pos] = d
+                if next_pos == tail:
+                    report(stats, expanded, frontier_peak, parents, snake_head, tail)
+                    return reconstruct_path(parents, moves, snake_head, tail)
+                queue.append(next_pos)
+    report(stats, expanded, frontier_peak, parents, snake_head, current_pos)
+    return []
+
+
+def ucs(board, snake_head, food, trace=None, stats=None):
+    queue = [(0, snake_head, snake_head, 0)]  # (cost, position, parent, direction index)
+    occupied = board.occupied
+    neighbors = board.neighbors
+    parents, moves = search_buffers(board)
+    expanded = frontier_peak = 0
+    last = snake_head
+
+    while queue:
+        if len(queue) > frontier_peak:
+            frontier_peak = len(queue)
+        cost, current_pos, parent, d = heapq.heappop(queue)
+        if trace is not None:
+            trace[current_pos] = 1
+
+        if parents[current_pos] == NO_PARENT:
+            # First time popped means cheapest, so this is the parent we keep
+            parents[current_pos] = parent
+            moves[current_pos] = d
+            expanded += 1
+            last = current_pos
+            if current_pos == food:
+                report(stats, expanded, frontier_peak, parents, snake_head, food)
+                return reconstruct_path(parents, moves, snake_head, food)
+            for d, next_pos in neighbors[current_pos]:
+                if not occupied[next_pos]:
+                    heapq.heappush(queue, (cost + 1, next_pos, current_pos, d))
+
+    report(stats, expanded, frontier_peak, parents, snake_head, last)
+    return []
+
+
+def euclidean_distance(start, goal):
+    return math.sqrt((start[0] - goal[0]) ** 2 + (start[1] - goal[1]) ** 2)
+
+
+def astar(board, snake_head, food, trace=None, distances=None, stats=None):
+    """A* with the Euclidean heuristic, or with `distances` (a DistanceField array) when given.
+
+    The distance field is the exact remaining cost on this board, so with it
+    A* walks straight down the field and skips cells with no path at all.
+    """
+    heap = [(0, snake_head, 0, snake_head, 0)]  # (f_cost, position, g_cost, parent, direction index)
+    occupied = board.occupied
+    neighbors = board.neighbors
+    parents, moves = search_buffers(board)
+    food_xy = board.xy(food)
+    unreachable = board.size
+    expanded = frontier_peak = 0
+    last = snake_head
+
+    while heap:
+        if len(heap) > frontier_peak:
+            frontier_peak = len(heap)
+        f_cost, current_pos, g_cost, parent, d = heapq.heappop(heap)
+        if trace is not None:
+            trace[current_pos] = 1
+
+        if parents[current_pos] == NO_PARENT:
+            parents[current_pos] = parent
+            moves[current_pos] = d
+            expanded += 1
+            last = current_pos
+            if current_pos == food:
+                report(stats, expanded, frontier_peak, parents, snake_head, food)
+                return reconstruct_path(parents, moves, snake_head, food)
+            for d, next_pos in neighbors[current_pos]:
+                if not occupied[next_pos]:
+                    if distances is None:
+                        h_cost = euclidean_distance(board.xy(next_pos), food_xy)
+                    else:
+                        h_cost = distances[next_pos]
+                        if h_cost == unreachable:
+                            continue
+                    heapq.heappush(heap, (g_cost + 1 + h_cost, next_pos, g_cost + 1, current_pos, d))
+
+    report(stats, expanded, frontier_peak, parents, snake_head, last)
+    return []
+
+
+def field_astar(board, snake_head, food, trace=None, stats=None):
+    """astar guided by the board's shared distance field."""
+    return astar(board, snake_head, food, trace, distance_field(board, food).distances, stats)
+
+
+def dfs_path(board, snake_head, food_pos, stats=None):
+    """Performs a depth-first search to find a path of cells from snake's head to food."""
+    stack = [snake_head]
+    parent = {snake_head: None}
+    visited = set()
+    occupied = board.occupied
+    expanded = frontier_peak = 0
+    last = snake_head
+
+    while stack:
+        if len(stack) > frontier_peak:
+            frontier_peak = len(stack)
+        position = stack.pop()
+
+        if position == food_pos:
+            # Found the path to the food
+            path = []
+            while position is not None:
+                path.append(position)
+                position = parent[position]
+            path.reverse()
+            if stats is not None:
+                stats.add(expanded + 1, frontier_peak, len(path) - 1)
+            return path
+
+        if position in visited:
+            continue
+        visited.add(position)
+        expanded += 1
+        last = position
+
+        for _, next_pos in board.neighbors[position]:
+            if not occupied[next_pos] and next_pos not in visited:
+                stack.append(next_pos)
+                parent[next_pos] = position
+
+    if stats is not None:
+        depth = 0
+        while parent[last] is not None:
+            last = parent[last]
+            depth += 1
+        stats.add(expanded, frontier_peak, depth)
+    return []  # Return an empty path if no path is found
+
+
+def dfs(board, snake_head, food, trace=None, stats=None):
+    """dfs_path returning (dx, dy) steps like the other searches; `trace` is ignored."""
+    cells = dfs_path(board, snake_head, food, stats)
+    path = []
+    for current_pos, next_pos in zip(cells, cells[1:]):
+        for d, neighbor in board.neighbors[current_pos]:
+            if neighbor == next_pos:
+                path.append(DIRECTIONS[d])
+                break
+    return path
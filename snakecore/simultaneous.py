@@ -0,0 +1,205 @@
+"""Simultaneous-move search for the two-snake game.
+
+The engine moves both snakes at once, but AISnake searches the game as if
+they took turns, and each snake runs its own search every tick. JointSearch
+models the tick as it is played: at every node both snakes pick a move, the
+nine (or so) joint moves are played together with the engine's collision
+rules, and the node's value is the value of that payoff matrix as a zero-sum
+game. One search gives both snakes their move for the tick.
+
+The payoff is snake 0's evaluation minus snake 1's, using AISnake.evaluate
+for each side. A matrix is solved either by pure maximin, or by regret
+matching, which converges to the mixed equilibrium.
+"""
+
+import time
+
+from .board import OFF_GRID
+from .minimax import AISnake, SearchTimeout
+
+# Payoff for a snake dying on its own, on top of the remaining depth so that
+# later deaths are preferred to earlier ones
+WIN = 100000
+
+
+def maximin(matrix):
+    """(row strategy, column strategy, value) of `matrix` in pure strategies.
+
+    The row player maximizes its worst case and the column player minimizes
+    its own; the value is the row player's guaranteed payoff.
+    """
+    rows, cols = len(matrix), len(matrix[0])
+    row_worst = [min(row) for row in matrix]
+    col_worst = [max(matrix[i][j] for i in range(rows)) for j in range(cols)]
+    best_row = max(range(rows), key=row_worst.__getitem__)
+    best_col = min(range(cols), key=col_worst.__getitem__)
+    row_strategy = [0.0] * rows
+    col_strategy = [0.0] * cols
+    row_strategy[best_row] = 1.0
+    col_strategy[best_col] = 1.0
+    return row_strategy, col_strategy, row_worst[best_row]
+
+
+def regret_matching(matrix, iterations=64):
+    """(row strategy, column strategy, value) of `matrix` from regret matching.
+
+    Both players play regret matching+ against each other for `iterations`
+    rounds; the average strategies approach a Nash equilibrium and the value
+    is the payoff of the average strategies. A matrix with a saddle point
+    (most of them, in practice) is answered by maximin without iterating.
+    """
+    row_strategy, col_strategy, value = maximin(matrix)
+    if value == max(row[col_strategy.index(1.0)] for row in matrix):
+        return row_strategy, col_strategy, value
+
+    rows, cols = len(matrix), len(matrix[0])
+    row_regret = [0.0] * rows
+    col_regret = [0.0] * cols
+    row_total = [0.0] * rows
+    col_total = [0.0] * cols
+    columns = list(zip(*matrix))
+    for _ in range(iterations):
+        p = _strategy(row_regret)
+        q = _strategy(col_regret)
+        row_values = [sum(qj * m for qj, m in zip(q, row)) for row in matrix]
+        col_values = [sum(pi * m for pi, m in zip(p, column)) for column in columns]
+        value = sum(pi * v for pi, v in zip(p, row_values))
+        for i in range(rows):
+            row_regret[i] = max(0.0, row_regret[i] + row_values[i] - value)
+            row_total[i] += p[i]
+        for j in range(cols):
+            col_regret[j] = max(0.0, col_regret[j] + value - col_values[j])
+            col_total[j] += q[j]
+    p = [total / iterations for total in row_total]
+    q = [total / iterations for total in col_total]
+    value = sum(pi * sum(qj * m for qj, m in zip(q, row)) for pi, row in zip(p, matrix))
+    return p, q, value
+
+
+def _strategy(regret):
+    # Play each move in proportion to its positive regret, uniformly if there is none
+    total = sum(regret)
+    if total <= 0:
+        return [1.0 / len(regret)] * len(regret)
+    return [r / total for r in regret]
+
+
+SOLVERS = {'maximin': maximin, 'regret': regret_matching}
+
+
+class JointSearch(AISnake):
+    """Searches `depth` ticks of joint moves for `snake` and `opponent` together.
+
+    A single-snake game (an opponent without a body) is searched with a
+    single "pass" column, which makes it a plain maximization.
+    """
+
+    def __init__(self, snake, opponent, food, width, height, wrap=False, solver='maximin', territory=False,
+                 regions=None, rng=None, workspace=None):
+        super().__init__(snake, opponent, food, width, height, wrap, territory=territory, regions=regions, rng=rng,
+                         workspace=workspace)
+        self.solve = SOLVERS[solver]
+
+    def get_best_moves(self, depth, time_budget=None, started=None):
+        """(Direction for snake, Direction for opponent or None) from a `depth`-tick search.
+
+        With a `time_budget` in milliseconds the search deepens one tick at a
+        time up to `depth` and keeps the deepest search that finished in time;
+        without one it searches `depth` ticks straight away. As in
+        AISnake.get_best_move the budget runs from `started`.
+        """
+        if started is None:
+            started = time.perf_counter()
+        self.setup_board()
+        self.nodes = 0
+        self.deadline = None
+        self.completed_depth = 0
+
+        if time_budget is None:
+            row_moves, col_moves, row_strategy, col_strategy = self.search_root(depth)
+            self.completed_depth = depth
+            return self.rng.choices(row_moves, row_strategy)[0], self.rng.choices(col_moves, col_strategy)[0]
+
+        row_moves, col_moves, row_strategy, col_strategy = self.search_root(1)
+        self.completed_depth = 1
+        self.deadline = started + time_budget / 1000.0
+        for iteration_depth in range(2, depth + 1):
+            try:
+                row_moves, col_moves, row_strategy, col_strategy = self.search_root(iteration_depth)
+            except SearchTimeout:
+                break
+            self.completed_depth = iteration_depth
+            if self.deadline is not None and time.perf_counter() >= self.deadline:
+                break
+
+        move = self.rng.choices(row_moves, row_strategy)[0]
+        opponent_move = self.rng.choices(col_moves, col_strategy)[0]
+        return move, opponent_move
+
+    def search_root(self, depth):
+        row_moves, col_moves, matrix = self.payoff_matrix(depth)
+        row_strategy, col_strategy, _ = self.solve(matrix)
+        return row_moves, col_moves, row_strategy, col_strategy
+
+    def payoff_matrix(self, depth):
+        """(our moves, opponent moves, payoffs) for the joint moves at this node."""
+        if self.territory and depth == 1:
+            self.regions = self.region_cache.get(self.hash, self.board)
+            if self.deadline is not None and time.perf_counter() > self.deadline:
+                raise SearchTimeout
+        row_moves = self.get_possible_moves(self.snake_body)
+        col_moves = self.get_possible_moves(self.opponent_body) if self.opponent_body else [None]
+        matrix = [[self.joint_move(move, opponent_move, depth) for opponent_move in col_moves]
+                  for move in row_moves]
+        return row_moves, col_moves, matrix
+
+    def joint_value(self, depth):
+        self.nodes += 1
+        if self.deadline is not None and self.nodes & 31 == 0 and time.perf_counter() > self.deadline:
+            raise SearchTimeout
+        if depth == 0:
+            return self.score()
+        _, _, matrix = self.payoff_matrix(depth)
+        return self.solve(matrix)[2]
+
+    def joint_move(self, move, opponent_move, depth):
+        """Plays both moves at once, as the engine does, and returns the resulting value."""
+        board = self.board
+        head = self.get_new_head(self.snake_body, move)
+        opponent_head = OFF_GRID if opponent_move is None else self.get_new_head(self.opponent_body, opponent_move)
+        eaten = head == self.food_cell or opponent_head == self.food_cell
+
+        # Play both before testing either: tails move out of the way first
+        tail = opponent_tail = None
+        if head != OFF_GRID:
+            tail = self.play(0, head, head == self.food_cell)
+        if opponent_head != OFF_GRID:
+            opponent_tail = self.play(1, opponent_head, opponent_head == self.food_cell)
+
+        dead = head == OFF_GRID or board.occupied[head] > 1
+        opponent_dead = opponent_move is not None and (opponent_head == OFF_GRID or board.occupied[opponent_head] > 1)
+        if dead or opponent_dead:
+            value = 0 if dead and opponent_dead else (WIN + depth) * (-1 if dead else 1)
+            self.nodes += 1
+        elif eaten:
+            # Where the food reappears is unknown, so the search stops here
+            self.nodes += 1
+            value = self.score()
+        else:
+            value = self.joint_value(depth - 1)
+
+        if opponent_tail is not None:
+            self.undo(1, opponent_tail)
+        if tail is not None:
+            self.undo(0, tail)
+        return value
+
+    def score(self):
+        """Snake 0's evaluation minus snake 1's."""
+        value = self.evaluate()
+        if not self.opponent_body:
+            return value
+        self.snake_body, self.opponent_body = self.opponent_body, self.snake_body
+        value -= self.evaluate()
+        self.snake_body, self.opponent_body = self.opponent_body, self.snake_body
+        return value
@@ -0,0 +1,90 @@
+"""Reachable-area heuristic for the minimax search.
+
+Counting every empty cell on the board cannot tell open space from a pocket
+the snake has already sealed itself into. RegionLabels flood-fills the free
+cells once into connected regions; the space a head can still reach is then
+the total size of the regions next to it, a handful of lookups.
+
+Labelling a board costs one pass over its free cells, so the search labels
+the position once per node just above the leaves and every sibling leaf
+reuses it (the leaves differ from it by a single head and tail move).
+RegionCache keeps recent labellings by Zobrist key, so transpositions do
+not flood-fill again either, up to a budget in bytes: a labelling holds a
+label per cell, so the number kept shrinks as the board grows.
+"""
+
+from array import array
+from collections import OrderedDict
+
+
+class RegionLabels:
+    def __init__(self, board):
+        occupied = board.occupied
+        neighbors = board.neighbors
+        # 0 means occupied; there are at most size / 2 + 1 regions, so two bytes do on most boards
+        self.labels = labels = array('h' if board.size <= 0x7fff else 'i', [0]) * board.size
+        self.sizes = sizes = [0]
+        seen = bytearray(occupied)
+        cell = seen.find(0)
+        while cell != -1:
+            label = len(sizes)
+            seen[cell] = 1
+            labels[cell] = label
+            stack = [cell]
+            size = 0
+            while stack:
+                current = stack.pop()
+                size += 1
+                for _, next_cell in neighbors[current]:
+                    if not seen[next_cell]:
+                        seen[next_cell] = 1
+                        labels[next_cell] = label
+                        stack.append(next_cell)
+            sizes.append(size)
+            cell = seen.find(0, cell + 1)
+
+    @property
+    def nbytes(self):
+        """Roughly what this labelling takes in memory."""
+        return self.labels.itemsize * len(self.labels) + 36 * len(self.sizes)
+
+    def reachable(self, board, head):
+        """Free cells reachable from `head`: the regions of its currently free neighbors."""
+        labels, occupied = self.labels, board.occupied
+        seen = []
+        area = 0
+        for _, cell in board.neighbors[head]:
+            label = labels[cell]
+            if label and not occupied[cell] and label not in seen:
+                seen.append(label)
+                area += self.sizes[label]
+        return area
+
+
+class RegionCache:
+    """The most recent RegionLabels, by position key, that fit in `budget` bytes (8 MiB)."""
+
+    def __init__(self, budget=8 << 20):
+        self.budget = budget
+        self.nbytes = 0
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, board):
+        regions = self.entries.get(key)
+        if regions is not None:
+            self.entries.move_to_end(key)
+            self.hits += 1
+            return regions
+        self.misses += 1
+        regions = RegionLabels(board)
+        self.entries[key] = regions
+        self.nbytes += regions.nbytes
+        while self.nbytes > self.budget and len(self.entries) > 1:
+            self.nbytes -= self.entries.popitem(last=False)[1].nbytes
+        return regions
+
+    def clear(self):
+        self.entries.clear()
+        self.nbytes = 0
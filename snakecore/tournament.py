@@ -0,0 +1,240 @@
+"""Plays many seeded headless games per agent on every core and ranks the agents.
+
+    python -m snakecore.tournament --games 1000 --agents bfs astar hill_climbing
+    python -m snakecore.tournament --games 200 --duel minimax minimax_territory --budget 5
+
+The first form plays single-snake games; `--duel` pits two agents against
+each other on a two-snake board and counts wins, losses and draws. `--budget`
+gives search agents that support it a fixed number of milliseconds per move.
+
+Every game gets its own seed (`--seed` plus the game number), which seeds
+the food and, through SnakeEngine.stream, every agent's random numbers, so
+a run can be repeated exactly and any single game can be replayed on its
+own. `--record DIR` also saves every game as a replay (see snakecore.replay).
+"""
+
+import argparse
+import os
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+
+from .agents import AGENTS
+from .engine import FULL, LEFT, RIGHT, SnakeEngine
+from .instrument import DecisionLog, InstrumentedAgent, histogram_percentile, merge_histograms
+from .replay import Recorder
+
+# `latency` is the histogram of decision times (see DecisionLog.histogram)
+GameResult = namedtuple('GameResult', 'agent seed score length steps moves decision_time max_decision_time latency '
+                                       'outcome')
+DuelResult = namedtuple('DuelResult', 'agents seed winner lengths steps decision_times')
+
+# Depth limit for agents on a time budget; the budget is what stops them
+BUDGET_DEPTH = 64
+
+# mcts takes tens of milliseconds a move, hours over the default games and
+# steps, so it only plays when asked for by name
+DEFAULT_AGENTS = sorted(name for name in AGENTS if name != 'mcts')
+
+
+def make_agent(agent_name, time_budget=None, engine=None, index=0):
+    """A fresh `agent_name` for snake `index`, drawing from the game's stream for it when given `engine`."""
+    agent = AGENTS[agent_name]()
+    if engine is not None and hasattr(agent, 'rng'):
+        agent.rng = engine.stream('agent%d' % index)
+    if time_budget is not None and hasattr(agent, 'time_budget'):
+        agent.time_budget = time_budget
+        if hasattr(agent, 'depth'):
+            agent.depth = BUDGET_DEPTH
+        if hasattr(agent, 'playouts'):
+            agent.playouts = None
+    return agent
+
+
+def play_game(agent_name, seed, width, height, max_steps, time_budget=None, record=None):
+    """Plays one single-snake game and returns its GameResult; saves its replay in the directory `record`."""
+    engine = SnakeEngine(width, height, max_steps=max_steps, seed=seed)
+    recorder = Recorder(engine) if record else None
+    log = DecisionLog(max_steps or 4096)
+    agent = InstrumentedAgent(make_agent(agent_name, time_budget, engine), log)
+    done = False
+    while not done:
+        done = engine.step([agent(engine.observe(), 0)])
+    if recorder is not None:
+        recorder.replay.save(os.path.join(record, '%s-%d.snkr' % (agent_name, seed)))
+    snake = engine.snakes[0]
+    return GameResult(agent_name, seed, snake.score, len(snake.body), engine.steps, log.decisions,
+                      log.total_time, log.worst_time, log.histogram('time'), engine.outcome)
+
+
+def play_duel(agent_names, seed, width, height, max_steps, time_budget=None, record=None):
+    """Plays one two-snake game and returns its DuelResult.
+
+    The snake still alive when the other dies wins. If both die together, or
+    time runs out, the longer snake wins and equal lengths are a draw. The
+    agents swap starting sides on odd seeds.
+    """
+    starts = [(width // 4, height // 2, RIGHT), (3 * width // 4, height // 2, LEFT)]
+    if seed % 2:
+        agent_names = agent_names[::-1]
+    engine = SnakeEngine(width, height, starts=starts, max_steps=max_steps, seed=seed)
+    recorder = Recorder(engine) if record else None
+    agents = [make_agent(name, time_budget, engine, index) for index, name in enumerate(agent_names)]
+    decision_times = [0.0, 0.0]
+    done = False
+    while not done:
+        obs = engine.observe()
+        actions = []
+        for index, agent in enumerate(agents):
+            start = time.perf_counter()
+            actions.append(agent(obs, index))
+            decision_times[index] += time.perf_counter() - start
+        done = engine.step(actions)
+    if recorder is not None:
+        recorder.replay.save(os.path.join(record, '%s-%s-%d.snkr' % (agent_names[0], agent_names[1], seed)))
+
+    alive = [snake.alive for snake in engine.snakes]
+    lengths = [len(snake.body) for snake in engine.snakes]
+    if alive[0] != alive[1]:
+        winner = agent_names[alive.index(True)]
+    elif lengths[0] != lengths[1]:
+        winner = agent_names[lengths.index(max(lengths))]
+    else:
+        winner = None
+    return DuelResult(tuple(agent_names), seed, winner, lengths, engine.steps, decision_times)
+
+
+def _play(args):
+    return play_game(*args)
+
+
+def _play_duel(args):
+    return play_duel(*args)
+
+
+def run_jobs(function, jobs, workers):
+    if workers == 1:
+        return list(map(function, jobs))
+    # One job at a time: games take from milliseconds to minutes depending on the agent, and
+    # handing them out singly keeps one worker from getting a chunk of only the slow ones
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(function, jobs))
+
+
+def run_tournament(agent_names, games, width, height, max_steps, seed=0, workers=None, time_budget=None,
+                   record=None):
+    """Plays `games` games per agent in a process pool; returns {agent: [GameResult]}."""
+    # Game-major, so the slow agents' games are spread over the whole run
+    jobs = [(name, seed + game, width, height, max_steps, time_budget, record)
+            for game in range(games) for name in agent_names]
+    played = run_jobs(_play, jobs, workers)
+    results = {name: [] for name in agent_names}
+    for result in played:
+        results[result.agent].append(result)
+    return results
+
+
+def _bucket(edge):
+    # Percentiles come from the latency histograms, so they are bucket edges (a quarter octave apart)
+    return float('inf') if edge is None else edge
+
+
+def summarize(results):
+    """One row of averages per agent, best mean score first."""
+    rows = []
+    for name, games in results.items():
+        moves = sum(game.moves for game in games) or 1
+        latency = merge_histograms(game.latency for game in games)
+        rows.append({
+            'agent': name,
+            'games': len(games),
+            'score': sum(game.score for game in games) / len(games),
+            'best': max(game.score for game in games),
+            'full': sum(1 for game in games if game.outcome == FULL),
+            'length': sum(game.length for game in games) / len(games),
+            'steps': sum(game.steps for game in games) / len(games),
+            'move_us': 1e6 * sum(game.decision_time for game in games) / moves,
+            'p50_us': _bucket(histogram_percentile(latency, 50)),
+            'p99_us': _bucket(histogram_percentile(latency, 99)),
+            'worst_move_ms': 1e3 * max(game.max_decision_time for game in games),
+        })
+    rows.sort(key=lambda row: row['score'], reverse=True)
+    return rows
+
+
+def run_duels(agent_names, games, width, height, max_steps, seed=0, workers=None, time_budget=None, record=None):
+    """Plays `games` duels between two agents in a process pool; returns [DuelResult]."""
+    jobs = [(tuple(agent_names), seed + game, width, height, max_steps, time_budget, record)
+            for game in range(games)]
+    return run_jobs(_play_duel, jobs, workers)
+
+
+def _name_width(names):
+    return max(len('agent'), *(len(name) for name in names))
+
+
+def format_duels(agent_names, duels):
+    width = _name_width(agent_names)
+    lines = ['%-*s %6s %6s %6s %9s %10s' % (width, 'agent', 'wins', 'losses', 'draws', 'win rate', 'move (ms)')]
+    draws = sum(1 for duel in duels if duel.winner is None)
+    for name in agent_names:
+        wins = sum(1 for duel in duels if duel.winner == name)
+        losses = len(duels) - wins - draws
+        time_spent = sum(duel.decision_times[duel.agents.index(name)] for duel in duels)
+        moves = sum(duel.steps for duel in duels) or 1
+        lines.append('%-*s %6d %6d %6d %8.1f%% %10.2f' % (
+            width, name, wins, losses, draws, 100.0 * wins / len(duels), 1e3 * time_spent / moves))
+    return '\n'.join(lines)
+
+
+def format_table(rows):
+    width = _name_width(row['agent'] for row in rows)
+    lines = ['%-*s %7s %8s %6s %5s %8s %9s %10s %9s %9s %14s' % (
+        width, 'agent', 'games', 'score', 'best', 'full', 'length', 'steps', 'move (us)', 'p50 (us)', 'p99 (us)',
+        'worst move (ms)')]
+    for row in rows:
+        lines.append('%-*s %7d %8.2f %6d %5d %8.2f %9.1f %10.1f %9.1f %9.1f %14.2f' % (
+            width, row['agent'], row['games'], row['score'], row['best'], row['full'], row['length'], row['steps'],
+            row['move_us'], row['p50_us'], row['p99_us'], row['worst_move_ms']))
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--agents', nargs='+', default=DEFAULT_AGENTS, choices=sorted(AGENTS),
+                        help='agents to play (default: all but mcts)')
+    parser.add_argument('-n', '--games', type=int, default=100, help='games per agent')
+    parser.add_argument('--duel', nargs=2, metavar='AGENT', choices=sorted(AGENTS),
+                        help='play two agents against each other instead')
+    parser.add_argument('--width', type=int, default=None, help='board width (default 20, or 32 for duels)')
+    parser.add_argument('--height', type=int, default=None, help='board height (default 20, or 24 for duels)')
+    parser.add_argument('--max-steps', type=int, default=5000, help='moves before a game is stopped')
+    parser.add_argument('--seed', type=int, default=0, help='seed of the first game')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: all cores)')
+    parser.add_argument('--budget', type=float, default=None, help='milliseconds per move for search agents')
+    parser.add_argument('--record', metavar='DIR', help='save a replay of every game in this directory')
+    args = parser.parse_args(argv)
+    if args.record:
+        if args.seed < 0:
+            parser.error('--record needs a --seed of 0 or more')
+        os.makedirs(args.record, exist_ok=True)
+
+    start = time.perf_counter()
+    if args.duel:
+        width, height = args.width or 32, args.height or 24
+        duels = run_duels(args.duel, args.games, width, height, args.max_steps,
+                          seed=args.seed, workers=args.workers, time_budget=args.budget, record=args.record)
+        print(format_duels(args.duel, duels))
+        played = args.games
+    else:
+        width, height = args.width or 20, args.height or 20
+        results = run_tournament(args.agents, args.games, width, height, args.max_steps,
+                                 seed=args.seed, workers=args.workers, time_budget=args.budget,
+                                 record=args.record)
+        print(format_table(summarize(results)))
+        played = args.games * len(args.agents)
+    print('%d games in %.1fs' % (played, time.perf_counter() - start))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,67 @@
+"""Zobrist hashing and a bounded transposition table for the minimax search.
+
+A position is the XOR of one random 64-bit key per (snake, body cell), one
+per (snake, head cell), one for the food cell and one for the side to move.
+Moving a head or a tail flips a couple of keys, so the hash is kept up to
+date in O(1) as the search plays and undoes moves.
+"""
+
+import random
+from collections import namedtuple
+from functools import lru_cache
+
+# What a stored value means with respect to the alpha-beta window it was searched with
+EXACT = 0
+LOWER = 1  # the true value is at least this (the search failed high)
+UPPER = 2  # the true value is at most this (the search failed low)
+
+ZobristKeys = namedtuple('ZobristKeys', 'body head food side')
+Entry = namedtuple('Entry', 'key depth value flag move generation')
+
+
+@lru_cache(maxsize=None)
+def zobrist_keys(size, snakes=2):
+    """Keys for a board of `size` cells; seeded so hashes are the same in every process."""
+    rng = random.Random(size * 31 + snakes)
+    body = [[rng.getrandbits(64) for _ in range(size)] for _ in range(snakes)]
+    head = [[rng.getrandbits(64) for _ in range(size)] for _ in range(snakes)]
+    food = [rng.getrandbits(64) for _ in range(size)]
+    return ZobristKeys(body, head, food, rng.getrandbits(64))
+
+
+class TranspositionTable:
+    """Fixed number of slots, indexed by the low bits of the Zobrist key.
+
+    On a collision the new entry wins if it was searched at least as deep as
+    the old one, or if the old one is left over from an earlier search
+    (`new_search` starts a new generation), so stale results age out.
+    """
+
+    def __init__(self, size_bits=16):
+        self.mask = (1 << size_bits) - 1
+        self.slots = [None] * (1 << size_bits)
+        self.generation = 0
+        self.probes = 0
+        self.hits = 0
+
+    def new_search(self):
+        self.generation += 1
+
+    def clear(self):
+        self.slots = [None] * len(self.slots)
+        self.generation = 0
+
+    def probe(self, key):
+        self.probes += 1
+        entry = self.slots[key & self.mask]
+        if entry is not None and entry.key == key:
+            self.hits += 1
+            return entry
+        return None
+
+    def store(self, key, depth, value, flag, move):
+        index = key & self.mask
+        old = self.slots[index]
+        if (old is None or old.key == key or depth >= old.depth
+                or old.generation != self.generation):
+            self.slots[index] = Entry(key, depth, value, flag, move, self.generation)
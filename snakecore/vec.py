@@ -0,0 +1,151 @@
+"""Many single-snake games stepped together with NumPy.
+
+SnakeEngine plays one game with Python lists, which is right for driving a
+window but tops out at a few tens of thousands of steps per second. VecSnakeEnv
+keeps `batch` games in arrays instead: a (batch, cells) occupancy count,
+every body as a ring buffer of cell indices, and the heads, food, directions
+and lengths as one value per game. A step moves all games with a handful of
+array operations, and games that end are reset in place, so the caller just
+keeps stepping.
+
+The rules are SnakeEngine's: tails move out of the way before heads are
+tested, a head off the grid (unless `wrap`) or on a body kills the snake, and
+eating grows it by one. Direction codes index DIRECTIONS (UP, DOWN, LEFT,
+RIGHT); -1 keeps the current direction.
+
+This is the only module besides render that needs a third-party package
+(numpy), so it is not imported by `snakecore` itself.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+
+from .board import DIRECTION_INDEX, OFF_GRID, RIGHT, step_tables
+
+VecObservation = namedtuple('VecObservation', 'head food direction length')
+
+
+class VecSnakeEnv:
+    """`batch` independent games of Snake on a `width` x `height` grid.
+
+    step(actions) returns (observation, reward, done): reward is 1 for eating,
+    -1 for dying and 0 otherwise; a game that is done has already been reset
+    when step returns, and `observation` shows its new start. `score` and
+    `steps` hold what the game had reached when it ended until the reset.
+    """
+
+    def __init__(self, batch, width, height, start=None, wrap=False, max_steps=None, seed=None):
+        self.batch = batch
+        self.width = width
+        self.height = height
+        self.size = width * height
+        self.wrap = wrap
+        self.max_steps = max_steps
+        x, y, direction = start or (width // 2, height // 2, RIGHT)
+        self.start_cell = y * width + x
+        self.start_direction = DIRECTION_INDEX[direction]
+        self.rng = np.random.default_rng(seed)
+        self.step_table = np.array(step_tables(width, height, wrap), dtype=np.int64)
+
+        self.rows = np.arange(batch)
+        self.offsets = self.rows * self.size  # occupancy is indexed flat: game * size + cell
+        self.occupied = np.zeros((batch, self.size), dtype=np.uint8)
+        self.body = np.zeros((batch, self.size), dtype=np.int64)  # ring buffers, head at body[game, head_slot]
+        self.head_slot = np.zeros(batch, dtype=np.int64)
+        self.length = np.zeros(batch, dtype=np.int64)
+        self.direction = np.zeros(batch, dtype=np.int64)
+        self.food = np.zeros(batch, dtype=np.int64)
+        self.score = np.zeros(batch, dtype=np.int64)
+        self.steps = np.zeros(batch, dtype=np.int64)
+        # Results of the games finished by the last step, before they were reset
+        self.final_score = np.zeros(batch, dtype=np.int64)
+        self.final_steps = np.zeros(batch, dtype=np.int64)
+        self.games = 0
+        self.reset()
+
+    @property
+    def head(self):
+        return self.body[self.rows, self.head_slot]
+
+    @property
+    def occupancy(self):
+        """The occupancy counts as a (batch, height, width) view."""
+        return self.occupied.reshape(self.batch, self.height, self.width)
+
+    def observe(self):
+        return VecObservation(self.head, self.food, self.direction, self.length)
+
+    def reset(self, games=None):
+        """Starts games `games` (an index array, or all of them) over."""
+        if games is None:
+            games = self.rows
+        if not len(games):
+            return self.observe()
+        self.occupied[games] = 0
+        self.occupied[games, self.start_cell] = 1
+        self.head_slot[games] = 0
+        self.body[games, 0] = self.start_cell
+        self.length[games] = 1
+        self.direction[games] = self.start_direction
+        self.score[games] = 0
+        self.steps[games] = 0
+        self.food[games] = self.spawn_food(games)
+        return self.observe()
+
+    def spawn_food(self, games):
+        """A random free cell for each of `games`, or OFF_GRID where the board is full."""
+        food = np.full(len(games), OFF_GRID, dtype=np.int64)
+        pending = np.flatnonzero(self.length[games] < self.size)
+        # Rejection sampling, a round for all games at once; few games need a second round
+        while len(pending):
+            cells = self.rng.integers(0, self.size, len(pending))
+            hit = self.occupied[games[pending], cells] == 0
+            food[pending[hit]] = cells[hit]
+            pending = pending[~hit]
+        return food
+
+    def step(self, actions):
+        """Moves the snake in every game; `actions` holds one direction code per game."""
+        actions = np.asarray(actions)
+        rows, occupied = self.rows, self.occupied.reshape(-1)
+        self.direction = np.where(actions >= 0, actions, self.direction)
+        head = self.body[rows, self.head_slot]
+        new_head = self.step_table[self.direction, head]
+        eaten = new_head == self.food
+
+        # Tails leave first, so following your own tail is safe
+        moving = ~eaten
+        tail_slot = (self.head_slot - self.length + 1) % self.size
+        tails = self.body[rows, tail_slot]
+        occupied[self.offsets[moving] + tails[moving]] -= 1
+
+        off_grid = new_head == OFF_GRID
+        target = self.offsets + np.where(off_grid, 0, new_head)
+        dead = off_grid | (occupied[target] > 0)
+        alive = ~dead
+        occupied[target[alive]] += 1
+        self.head_slot = np.where(alive, (self.head_slot + 1) % self.size, self.head_slot)
+        self.body[rows[alive], self.head_slot[alive]] = new_head[alive]
+
+        grown = eaten & alive
+        self.length += grown
+        self.score += grown
+        self.steps += 1
+        full = self.length == self.size
+        fed = np.flatnonzero(grown & ~full)
+        if len(fed):
+            self.food[fed] = self.spawn_food(fed)
+
+        reward = grown.astype(np.float32)
+        reward[dead] = -1.0
+        done = dead | full
+        if self.max_steps is not None:
+            done |= self.steps >= self.max_steps
+        finished = np.flatnonzero(done)
+        if len(finished):
+            self.final_score[finished] = self.score[finished]
+            self.final_steps[finished] = self.steps[finished]
+            self.games += len(finished)
+            self.reset(finished)
+        return self.observe(), reward, done
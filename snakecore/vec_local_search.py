@@ -0,0 +1,189 @@
+"""hill_climbing and simulated_annealing for every game of a VecSnakeEnv at once.
+
+Both return one direction code per game (an index into DIRECTIONS) and make
+exactly the choices the scalar functions in local_search make for the same
+position: the four neighbors of every head are scored in one array
+operation instead of a Python loop with math.sqrt and list membership.
+
+simulated_annealing also draws the same random numbers. Each game has its
+own random.Random; the batch reads the Mersenne Twister words that generator
+would produce, replays random.choice and random.random from them for all
+games together, and then advances each generator past the words it used,
+so a game run this way matches a game run with the scalar function and the
+same seed, draw for draw.
+"""
+
+import numpy as np
+
+from .board import OFF_GRID
+
+# random.choice over four directions takes the top (4).bit_length() bits of a
+# word and retries values >= 4 (Random._randbelow); random.random is two words
+CHOICE_SHIFT = 32 - (4).bit_length()
+RANDOM_SCALE = 1.0 / 9007199254740992.0  # 2 ** -53
+
+
+def neighbors(env):
+    """(candidate heads, valid) as (4, batch) arrays, in DIRECTIONS order.
+
+    A move is valid if it stays on the grid and lands on a free cell or on
+    the tail, which moves out of the way first (Snake.collides in the scalar
+    functions).
+    """
+    rows = env.rows
+    heads = env.step_table[:, env.head]
+    tails = env.body[rows, (env.head_slot - env.length + 1) % env.size]
+    on_grid = heads != OFF_GRID
+    free = env.occupied[rows, np.where(on_grid, heads, 0)] == 0
+    valid = on_grid & (free | (heads == tails))
+    return heads, valid
+
+
+def squared_distances(env, cells):
+    # Squared distance orders moves exactly as math.sqrt of it does
+    width = env.width
+    dx = cells % width - env.food % width
+    dy = cells // width - env.food // width
+    return dx * dx + dy * dy
+
+
+def hill_climbing(env):
+    """Direction code for every game: the valid move closest to the food, else the current direction."""
+    heads, valid = neighbors(env)
+    distances = np.where(valid, squared_distances(env, heads), np.iinfo(np.int64).max)
+    # argmin keeps the first of equal moves, as the scalar loop's strict < does
+    return np.where(valid.any(axis=0), distances.argmin(axis=0), env.direction)
+
+
+def schedule(temperature=10.0, cooling_rate=0.99):
+    """The temperatures simulated_annealing runs through, computed as it does."""
+    temperatures = []
+    while temperature > 0.1:
+        temperatures.append(temperature)
+        temperature *= cooling_rate
+    return np.array(temperatures)
+
+
+def twist(key):
+    """The next Mersenne Twister state for every row of `key`, a (games, 624) uint32 array."""
+    new = np.empty_like(key)
+
+    def mix(upper, lower, source):
+        y = (upper & 0x80000000) | (lower & 0x7fffffff)
+        return source ^ (y >> 1) ^ np.where(y & 1, np.uint32(0x9908b0df), np.uint32(0))
+
+    # Each word depends on the one 397 ahead, which from word 227 on has already been replaced
+    new[:, :227] = mix(key[:, :227], key[:, 1:228], key[:, 397:])
+    new[:, 227:454] = mix(key[:, 227:454], key[:, 228:455], new[:, :227])
+    new[:, 454:623] = mix(key[:, 454:623], key[:, 455:624], new[:, 227:396])
+    new[:, 623] = mix(key[:, 623], new[:, 0], new[:, 396])
+    return new
+
+
+def temper(key):
+    y = key ^ (key >> 11)
+    y ^= (y << 7) & 0x9d2c5680
+    y ^= (y << 15) & 0xefc60000
+    return y ^ (y >> 18)
+
+
+class MersenneWords:
+    """The next `count` outputs of every random.Random in `rngs`, generated together.
+
+    `words` is a (games, count) uint32 array; advance(used) then moves each
+    generator past the words its game used.
+    """
+
+    def __init__(self, rngs, count):
+        self.rngs = rngs
+        self.states = [rng.getstate() for rng in rngs]
+        states = np.array([state for _, state, _ in self.states], dtype=np.int64)
+        self.pos = states[:, -1]
+        self.keys = [states[:, :-1].astype(np.uint32)]
+        blocks = [temper(self.keys[0])]
+        while 624 * len(blocks) < int(self.pos.max()) + count:
+            self.keys.append(twist(self.keys[-1]))
+            blocks.append(temper(self.keys[-1]))
+        stream = np.concatenate(blocks, axis=1)
+        self.words = stream[np.arange(len(rngs))[:, None], self.pos[:, None] + np.arange(count)]
+
+    def advance(self, used):
+        for game, (rng, count) in enumerate(zip(self.rngs, used)):
+            if not count:
+                continue
+            # Python twists lazily: after the last word of a block it sits at pos 624
+            last = int(self.pos[game] + count - 1)
+            key = self.keys[last // 624][game]
+            version, _, gauss = self.states[game]
+            rng.setstate((version, tuple(key.tolist()) + (last % 624 + 1,), gauss))
+
+
+def simulated_annealing(env, rngs, temperature=10.0, cooling_rate=0.99):
+    """Direction code for every game.
+
+    `rngs` is either one random.Random per game, which reproduces the scalar
+    function's draws exactly, or a single numpy Generator, which skips the
+    per-game bookkeeping and draws the same distribution much faster.
+    """
+    temperatures = schedule(temperature, cooling_rate)
+    if isinstance(rngs, np.random.Generator):
+        shape = (len(temperatures), env.batch)
+        directions, _ = anneal(env, temperatures, rngs.integers(0, 4, shape), rngs.random(shape))
+        return directions
+
+    # A step takes two words on average for the choice and at most two for
+    # random.random; this is many standard deviations more than that, and a
+    # batch that still runs out simply starts over with twice as many
+    count = 4 * len(temperatures) + 256
+    while True:
+        mersenne = MersenneWords(rngs, count)
+        directions, used = anneal(env, temperatures, words=mersenne.words)
+        if used is not None:
+            mersenne.advance(used)
+            return directions
+        count *= 2
+
+
+def anneal(env, temperatures, choices=None, uniforms=None, words=None):
+    """(direction codes, words used per game) for the annealing run.
+
+    The draws are either `choices` and `uniforms`, one per step and game, or
+    the Mersenne Twister `words` of each game, consumed the way random.choice
+    and random.random would. Returns (None, None) if `words` ran out.
+    """
+    heads, valid = neighbors(env)
+    distances = np.sqrt(squared_distances(env, heads))  # (4, batch)
+    rows = env.rows
+    current_direction = env.direction.copy()
+    current_distance = np.sqrt(squared_distances(env, env.head))
+
+    if words is not None:
+        count = words.shape[1]
+        word_choices = words >> CHOICE_SHIFT
+        # next_choice[game, i]: first word at or after i that random.choice accepts
+        positions = np.where(word_choices < 4, np.arange(count), count - 3)
+        next_choice = np.minimum.accumulate(positions[:, ::-1], axis=1)[:, ::-1]
+        word_uniforms = ((words[:, :-1] >> 5).astype(np.float64) * 67108864.0 + (words[:, 1:] >> 6)) * RANDOM_SCALE
+        cursor = np.zeros(len(rows), dtype=np.int64)
+
+    for step, temperature in enumerate(temperatures):
+        if words is None:
+            direction, uniform = choices[step], uniforms[step]
+        else:
+            chosen = next_choice[rows, cursor]
+            direction = word_choices[rows, chosen].astype(np.int64)
+            cursor = chosen + 1
+            uniform = word_uniforms[rows, cursor]
+        ok = valid[direction, rows]
+        new_distance = distances[direction, rows]
+        better = ok & (new_distance < current_distance)
+        # Only a valid move that is not better draws random.random()
+        draw = ok & ~better
+        accept = better | (draw & (uniform < np.exp((current_distance - new_distance) / temperature)))
+        current_direction = np.where(accept, direction, current_direction)
+        current_distance = np.where(accept, new_distance, current_distance)
+        if words is not None:
+            cursor = np.where(draw, cursor + 2, cursor)
+            if cursor.max() >= count - 3:
+                return None, None
+    return current_direction, (cursor if words is not None else None)